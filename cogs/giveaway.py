@@ -1,26 +1,141 @@
+from array import array
+from bisect import bisect_left
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Set, Any
+from dataclasses import dataclass, asdict
+from heapq import merge
+from typing import Optional, List, Dict, Set, Any, Iterable, Iterator
 import discord
 from discord import app_commands, Interaction
 from discord.ext import commands, tasks
+import csv
+import gzip
+import json
+import os
 import random
+import tempfile
+import re
+import zlib
 import asyncio
 import aiosqlite
 from datetime import datetime, timezone
 from discord.ui import TextDisplay
 
 from config import GDB_PATH
-from utils.time import get_duration_to_seconds, get_now_plus_seconds_unix
+from utils.roles import RoleGrantService
+from utils.time import get_duration_to_seconds, get_now_plus_seconds_unix, format_seconds_to_duration
 
 ADJECTIVES = ["alpha", "beta", "delta", "sonic", "prime", "global", "pivot", "solid", "static", "linear", "vital", "core", "urban", "nomad"]
 NOUNS = ["node", "link", "point", "base", "grid", "zone", "unit", "flux", "pillar", "vector", "path", "shift", "pulse", "forge"]
 
 
+HISTORY_START = (2 ** 63 - 1, 2 ** 63 - 1)
+EXPORT_CHUNK_SIZE = 1000
+JOIN_DEBOUNCE_SECONDS = 3.0
+USAGE_FLUSH_SECONDS = 60
+REVIEW_QUEUE_START = (0, "")
+SCHEDULE_RETRY_SECONDS = 300
+SCHEDULE_MAX_ATTEMPTS = 3
+
+ARCHIVE_AFTER_DAYS = 30
+ARCHIVE_BATCH_SIZE = 50
+
+TEMPLATE_SORTS = {
+    "popular": "popularity_rank ASC, template_id",
+    "unpopular": "popularity_rank DESC, template_id",
+    "alpha": "prize COLLATE NOCASE ASC, template_id",
+    "revalpha": "prize COLLATE NOCASE DESC, template_id",
+}
+
+
 def generate_template_id():
     return f"{random.choice(ADJECTIVES)}-{random.choice(NOUNS)}-{random.randint(100, 999)}".lower()
 
 
+def pack_participants(user_ids: Iterable[int]) -> bytes:
+    return zlib.compress(array("Q", user_ids).tobytes())
+
+
+def unpack_participants(blob: Optional[bytes]) -> array:
+    user_ids = array("Q")
+    if blob:
+        user_ids.frombytes(zlib.decompress(blob))
+    return user_ids
+
+
+def build_fts_query(text: str) -> str:
+    terms = re.findall(r"\w+", text)
+    return " ".join(f'"{term}"*' for term in terms) or '""'
+
+
+def escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class ParticipantSet:
+    __slots__ = ("_base", "_added", "_removed")
+
+    def __init__(self, user_ids: Iterable[int] = ()):
+        self._base = array("Q", sorted(set(user_ids)))
+        self._added: Set[int] = set()
+        self._removed: Set[int] = set()
+
+    def _in_base(self, user_id: int) -> bool:
+        i = bisect_left(self._base, user_id)
+        return i < len(self._base) and self._base[i] == user_id
+
+    def __contains__(self, user_id: int) -> bool:
+        if user_id in self._added:
+            return True
+        if user_id in self._removed:
+            return False
+        return self._in_base(user_id)
+
+    def __len__(self) -> int:
+        return len(self._base) - len(self._removed) + len(self._added)
+
+    def __iter__(self) -> Iterator[int]:
+        removed = self._removed
+        for user_id in self._base:
+            if user_id not in removed:
+                yield user_id
+        yield from self._added
+
+    def add(self, user_id: int):
+        if user_id in self._removed:
+            self._removed.discard(user_id)
+        elif not self._in_base(user_id):
+            self._added.add(user_id)
+        self._maybe_compact()
+
+    def discard(self, user_id: int):
+        if user_id in self._added:
+            self._added.discard(user_id)
+        elif self._in_base(user_id):
+            self._removed.add(user_id)
+        self._maybe_compact()
+
+    def remove(self, user_id: int):
+        if user_id not in self:
+            raise KeyError(user_id)
+        self.discard(user_id)
+
+    def _maybe_compact(self):
+        if len(self._added) + len(self._removed) > max(1024, len(self._base) >> 4):
+            self.compact()
+
+    def sorted_view(self) -> array:
+        if self._added or self._removed:
+            self.compact()
+        return self._base
+
+    def compact(self):
+        removed = self._removed
+        kept = (user_id for user_id in self._base if user_id not in removed)
+        self._base = array("Q", merge(kept, sorted(self._added)))
+        self._added = set()
+        self._removed = set()
+
+
 @dataclass
 class GiveawayDraft:
     guild_id: int
@@ -37,6 +152,9 @@ class GiveawayDraft:
     image: Optional[str] = None
     thumbnail: Optional[str] = None
     color: str = "discord.Color(0x944ae8)"
+    start_time: Optional[int] = None
+    min_account_age: int = 0
+    min_server_age: int = 0
 
 
 class PrivateView(discord.ui.View):
@@ -149,13 +267,19 @@ class GiveawayEditSelect(discord.ui.Select):
                                  description="Provide a valid URL for the Embed image."),
             discord.SelectOption(label="12. Thumbnail", value="thumbnail",
                                  description="Provide a valid URL for the Embed thumbnail."),
-            discord.SelectOption(label="13. Colour", value="color", description="Set embed color (Hex or Valid Name).")
+            discord.SelectOption(label="13. Colour", value="color", description="Set embed color (Hex or Valid Name)."),
+            discord.SelectOption(label="14. Start Time", value="start",
+                                 description="Schedule the giveaway to start later (e.g., 2h, 1d)."),
+            discord.SelectOption(label="15. Minimum Account Age", value="account_age",
+                                 description="How old an account must be to participate (e.g., 30d)."),
+            discord.SelectOption(label="16. Minimum Server Age", value="server_age",
+                                 description="How long a member must have been in the server (e.g., 7d).")
         ]
         super().__init__(placeholder="Select a setting to customize...", options=options)
 
     async def callback(self, interaction: discord.Interaction):
         value = self.values[0]
-        if value in ["prize", "winners", "duration"]:
+        if value in ["prize", "winners", "duration", "start", "account_age", "server_age"]:
             return await interaction.response.send_modal(GiveawayMetadataModal(value, self.draft, self.parent_view))
 
         if value in ["image", "thumbnail", "color"]:
@@ -199,7 +323,8 @@ class GiveawayEditSelect(discord.ui.Select):
 
 class GiveawayMetadataModal(discord.ui.Modal):
     def __init__(self, trait: str, draft: GiveawayDraft, parent_view):
-        super().__init__(title=f"Edit Giveaway {trait.title()}")
+        trait_name = {"account_age": "Account Age", "server_age": "Server Age"}.get(trait, trait.title())
+        super().__init__(title=f"Edit Giveaway {trait_name}")
         self.trait = trait
         self.draft = draft
         self.parent_view = parent_view
@@ -211,10 +336,18 @@ class GiveawayMetadataModal(discord.ui.Modal):
             current_value = str(self.draft.winners)
         elif trait == "duration":
             current_value = str(self.draft.duration)
+        elif trait == "account_age":
+            current_value = format_seconds_to_duration(self.draft.min_account_age) if self.draft.min_account_age else "0"
+        elif trait == "server_age":
+            current_value = format_seconds_to_duration(self.draft.min_server_age) if self.draft.min_server_age else "0"
 
         placeholder = "e.g. 1d 12h" if trait == "duration" else "Type here..."
+        if trait == "start":
+            placeholder = "Delay from now, e.g. 2h (0 to start immediately)"
+        elif trait in ["account_age", "server_age"]:
+            placeholder = "e.g. 30d (0 to disable)"
         self.input_field = discord.ui.TextInput(
-            label=f"Enter {trait.title()}",
+            label=f"Enter {trait_name}",
             placeholder=placeholder,
             default=current_value,
             required=True
@@ -235,6 +368,22 @@ class GiveawayMetadataModal(discord.ui.Modal):
             if seconds <= 0:
                 return await interaction.response.send_message("Invalid duration format!", ephemeral=True)
             self.draft.duration = value
+        elif self.trait == "start":
+            if value.strip() == "0":
+                self.draft.start_time = None
+            else:
+                seconds = get_duration_to_seconds(value)
+                if seconds <= 0:
+                    return await interaction.response.send_message("Invalid start delay format!", ephemeral=True)
+                self.draft.start_time = get_now_plus_seconds_unix(seconds)
+        elif self.trait in ["account_age", "server_age"]:
+            seconds = get_duration_to_seconds(value)
+            if seconds <= 0 and not re.match(r"^\s*0\s*(?:mon|w|d|h|m|s)?\s*$", value.lower()):
+                return await interaction.response.send_message("Invalid age format!", ephemeral=True)
+            if self.trait == "account_age":
+                self.draft.min_account_age = seconds
+            else:
+                self.draft.min_server_age = seconds
 
         new_embed = self.parent_view.cog.create_giveaway_embed(self.draft)
         await self.parent_view.message.edit(embed=new_embed)
@@ -317,7 +466,7 @@ class GoToPageModalPaginator(discord.ui.Modal):
 
 
 class ParticipantPaginator(discord.ui.View):
-    def __init__(self, bot, participants: list, prize: str, extra_roles: list, guild: discord.Guild):
+    def __init__(self, bot, participants, prize: str, extra_roles: list, guild: discord.Guild):
         super().__init__(timeout=120)
         self.bot = bot
         self.prize = prize
@@ -326,39 +475,34 @@ class ParticipantPaginator(discord.ui.View):
         self.per_page = 10
         self.show_tags = False
 
-        self.processed_participants = self._process_participants(participants, extra_roles)
-
-    def _process_participants(self, participants, extra_roles):
-        data = []
-        for uid in participants:
-            entries = 1
-            member = self.guild.get_member(uid) or self.guild.fetch_member(uid)
-            if member and extra_roles:
-                for role_id in extra_roles:
-                    if any(r.id == role_id for r in member.roles):
-                        entries += 1
-            data.append({'id': uid, 'entries': entries})
+        self.participants = participants
+        self.extra_roles = set(extra_roles)
 
-        return sorted(data, key=lambda x: (x['entries'], x['id']), reverse=True)
+    def _count_entries(self, uid: int) -> int:
+        entries = 1
+        member = self.guild.get_member(uid)
+        if member and self.extra_roles:
+            entries += sum(1 for r in member.roles if r.id in self.extra_roles)
+        return entries
 
     def get_embed(self):
         start = self.current_page * self.per_page
         end = start + self.per_page
-        page_list = self.processed_participants[start:end]
+        page_list = self.participants[start:end]
 
         lines = []
-        for item in page_list:
-            user = self.bot.get_user(item['id'])
+        for uid in page_list:
+            user = self.bot.get_user(uid)
             if user:
                 name = user.name if self.show_tags else f"<@{user.id}>"
             else:
-                name = f"Unknown({item['id']})"
+                name = f"Unknown({uid})"
 
-            lines.append(f"• **{name}** (**{item['entries']}** entries)")
+            lines.append(f"• **{name}** (**{self._count_entries(uid)}** entries)")
 
         mentions = "\n".join(lines) or "No participants yet."
-        total_pages = (len(self.processed_participants) - 1) // self.per_page + 1
-        total_count = len(self.processed_participants)
+        total_count = len(self.participants)
+        total_pages = (total_count - 1) // self.per_page + 1
 
         embed = discord.Embed(
             title=f"<:dopamine:1445805701355012279> Participants for **{self.prize}**",
@@ -376,12 +520,12 @@ class ParticipantPaginator(discord.ui.View):
 
     @discord.ui.button(label="Go To Page", style=discord.ButtonStyle.gray)
     async def go_to_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        total_pages = (len(self.processed_participants) - 1) // self.per_page + 1
+        total_pages = (len(self.participants) - 1) // self.per_page + 1
         await interaction.response.send_modal(GoToPageModalPaginator(self.current_page, total_pages, self))
 
     @discord.ui.button(label="▶️", style=discord.ButtonStyle.gray)
     async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if (self.current_page + 1) * self.per_page < len(self.processed_participants):
+        if (self.current_page + 1) * self.per_page < len(self.participants):
             self.current_page += 1
             await interaction.response.edit_message(embed=self.get_embed(), view=self)
 
@@ -443,32 +587,33 @@ class GiveawayPreviewView(PrivateView):
             await self.cog.save_template(interaction, self.draft)
             return
 
-        channel = self.cog.bot.get_channel(self.draft.channel_id)
+        now = int(discord.utils.utcnow().timestamp())
+        if self.draft.start_time and self.draft.start_time > now:
+            channel = self.cog.bot.get_channel(self.draft.channel_id)
+            if not channel:
+                try:
+                    channel = await self.cog.bot.fetch_channel(self.draft.channel_id)
+                except (discord.Forbidden, discord.NotFound):
+                    return await interaction.followup.send(
+                        "I searched far and wide, but I can't find the channel chosen for the giveaway!\n\nEnsure that I have the necessary permissions.",
+                        ephemeral=True)
+            await self.cog.schedule_giveaway(self.draft, interaction.user.id)
+            success_embed = discord.Embed(
+                description=f"Giveaway scheduled to start **<t:{self.draft.start_time}:R>** in {channel.mention}!",
+                colour=discord.Colour.green())
+            await interaction.followup.send(embed=success_embed, ephemeral=True)
+            await interaction.message.delete()
+            return self.stop()
+
+        channel, giveaway_id = await self.cog.launch_giveaway(self.draft)
         if not channel:
-            try:
-                channel = await self.cog.bot.fetch_channel(self.draft.channel_id)
-            except (discord.Forbidden, discord.NotFound):
-                return await interaction.response.send_message(
-                    "I searched far and wide, but I can't find the channel chosen for the giveaway!\n\nEnsure that I have the necessary permissions.",
-                    ephemeral=True)
-
-        giveaway_id = int(discord.utils.utcnow().timestamp()) + random.randint(1, 69)
-
-        seconds = get_duration_to_seconds(self.draft.duration)
-        end_time = get_now_plus_seconds_unix(seconds)
-
-        view = GiveawayJoinView(self.cog, giveaway_id)
+            return await interaction.followup.send(
+                "I searched far and wide, but I can't find the channel chosen for the giveaway!\n\nEnsure that I have the necessary permissions.",
+                ephemeral=True)
 
-        embed = self.cog.create_giveaway_embed(self.draft, preview_active_end=end_time)
-        embed.set_footer(text=f"ID: {giveaway_id}")
-        msg = await channel.send(embed=embed, view=view)
-
-        await self.cog.save_giveaway(self.draft, msg.id, giveaway_id, end_time)
-        self.cog.bot.add_view(view)
         success_embed = discord.Embed(description=f"Giveaway started successfully in {channel.mention}!",
                                       colour=discord.Colour.green())
-        embed.set_footer(text=f"ID: {giveaway_id}")
-        await interaction.response.send_message(embed=success_embed, ephemeral=True)
+        await interaction.followup.send(embed=success_embed, ephemeral=True)
         await interaction.message.delete()
         self.stop()
 
@@ -562,43 +707,48 @@ class WinnerRoleSelectView(discord.ui.View):
         await interaction.response.send_message(f"Updated {self.key} successfully!", ephemeral=True)
 
 
-class GiveawayJoinView(discord.ui.View):
+class GiveawayJoinButton(discord.ui.DynamicItem[discord.ui.Button], template=r"gw:join:(?P<id>[0-9]+)"):
     def __init__(self, cog, giveaway_id: int):
-        super().__init__(timeout=None)
         self.cog = cog
         self.giveaway_id = giveaway_id
+        count = len(cog.participant_cache.get(giveaway_id, ())) if cog else 0
+        super().__init__(
+            discord.ui.Button(
+                emoji="🎉",
+                label=f"{count}",
+                style=discord.ButtonStyle.blurple,
+                custom_id=f"gw:join:{giveaway_id}"
+            )
+        )
 
-        self.join_button.custom_id = f"gw:join:{giveaway_id}"
-        self.list_button.custom_id = f"gw:list:{giveaway_id}"
-
-        self.update_button_label()
-
-    def update_button_label(self):
-        count = len(self.cog.participant_cache.get(self.giveaway_id, set()))
-        self.join_button.label = f"{count}" if count > 0 else "0"
-
-    @discord.ui.button(
-        emoji="🎉",
-        style=discord.ButtonStyle.blurple
-    )
-    async def join_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not interaction.message.embeds:
-            return await interaction.response.send_message(
-                "Uh-oh! I'm afraid that the message you interacted with doesn't exist anymore :3", ephemeral=True)
-
-        footer_text = interaction.message.embeds[0].footer.text
-        try:
-            giveaway_id = int(footer_text.split(": ")[1])
-        except (IndexError, ValueError):
-            return await interaction.response.send_message("Uh-oh! I couldn't find the Giveaway ID. Perhaps try again?",
-                                                           ephemeral=True)
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(interaction.client.get_cog("Giveaways"), int(match["id"]))
 
-        g = self.cog.giveaway_cache.get(giveaway_id)
+    async def callback(self, interaction: discord.Interaction):
+        giveaway_id = self.giveaway_id
+        g = self.cog.giveaway_cache.get(giveaway_id) if self.cog else None
 
         if not g or g['ended'] == 1:
             return await interaction.response.send_message("Uh-oh! I'm afraid that this giveaway has already ended!",
                                                            ephemeral=True)
 
+        now = discord.utils.utcnow().timestamp()
+        min_account_age = g.get('min_account_age') or 0
+        if min_account_age:
+            created_at = ((interaction.user.id >> 22) + discord.utils.DISCORD_EPOCH) / 1000
+            if now - created_at < min_account_age:
+                return await interaction.response.send_message(
+                    f"Uh-oh! Your account must be at least **{format_seconds_to_duration(min_account_age)}** old to join this giveaway.",
+                    ephemeral=True)
+
+        min_server_age = g.get('min_server_age') or 0
+        joined_at = getattr(interaction.user, "joined_at", None)
+        if min_server_age and (not joined_at or now - joined_at.timestamp() < min_server_age):
+            return await interaction.response.send_message(
+                f"Uh-oh! You must have been in this server for at least **{format_seconds_to_duration(min_server_age)}** to join this giveaway.",
+                ephemeral=True)
+
         if g['blacklisted_roles']:
             blacklisted_ids = [int(r) for r in g['blacklisted_roles'].split(",")]
             if any(role.id in blacklisted_ids for role in interaction.user.roles):
@@ -621,50 +771,48 @@ class GiveawayJoinView(discord.ui.View):
                         "Uh-oh! You cannot join this giveaway because you don't have one of the required roles.",
                         ephemeral=True)
 
-        participants = self.cog.participant_cache.get(giveaway_id, set())
-
-        async with self.cog.acquire_db() as db:
-            if interaction.user.id in participants:
-                participants.remove(interaction.user.id)
-                await db.execute("DELETE FROM giveaway_participants WHERE giveaway_id = ? AND user_id = ?",
-                                 (giveaway_id, interaction.user.id))
-                msg = "You have successfully left the giveaway."
-            else:
-                participants.add(interaction.user.id)
-                await db.execute("INSERT INTO giveaway_participants (guild_id, giveaway_id, user_id) VALUES (?, ?, ?)",
-                                 (interaction.guild_id, giveaway_id, interaction.user.id))
-                msg = "🎉 You have successfully entered the giveaway!"
-            await db.commit()
-
-        self.update_button_label()
+        result = await self.cog.toggle_participant(interaction.guild_id, giveaway_id, interaction.user.id,
+                                                   interaction.created_at.timestamp())
+        if result is None:
+            return await interaction.response.send_message("Uh-oh! I'm afraid that this giveaway has already ended!",
+                                                           ephemeral=True)
+        if result == "duplicate":
+            return await interaction.response.send_message(
+                "Your last click is still being processed, so nothing was changed.", ephemeral=True)
+        if result == "joined":
+            msg = "🎉 You have successfully entered the giveaway!"
+        else:
+            msg = "You have successfully left the giveaway."
 
         await interaction.response.send_message(msg, ephemeral=True)
         try:
-            await interaction.message.edit(view=self)
+            await interaction.message.edit(view=GiveawayJoinView(self.cog, giveaway_id))
         except discord.HTTPException:
             pass
 
-    @discord.ui.button(
-        label="👤 Participants",
-        style=discord.ButtonStyle.gray,
-    )
-    async def list_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not interaction.message.embeds:
-            return await interaction.response.send_message(
-                "Uh-oh! I'm afraid that the message you interacted with doesn't exist anymore :3", ephemeral=True)
 
-        footer_text = interaction.message.embeds[0].footer.text
+class GiveawayListButton(discord.ui.DynamicItem[discord.ui.Button], template=r"gw:list:(?P<id>[0-9]+)"):
+    def __init__(self, cog, giveaway_id: int):
+        self.cog = cog
+        self.giveaway_id = giveaway_id
+        super().__init__(
+            discord.ui.Button(
+                label="👤 Participants",
+                style=discord.ButtonStyle.gray,
+                custom_id=f"gw:list:{giveaway_id}"
+            )
+        )
 
-        try:
-            giveaway_id = int(footer_text.split(": ")[1])
-        except (IndexError, ValueError):
-            return await interaction.response.send_message("Uh-oh! I couldn't parse Giveaway ID. Maybe try again?",
-                                                           ephemeral=True)
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(interaction.client.get_cog("Giveaways"), int(match["id"]))
 
-        participant_set = self.cog.participant_cache.get(giveaway_id, set())
-        participants = list(participant_set)
+    async def callback(self, interaction: discord.Interaction):
+        giveaway_id = self.giveaway_id
+        participant_set = self.cog.participant_cache.get(giveaway_id) if self.cog else None
+        participants = participant_set.sorted_view() if participant_set else ()
 
-        g = self.cog.giveaway_cache.get(giveaway_id)
+        g = self.cog.giveaway_cache.get(giveaway_id) if self.cog else None
         if not g:
             return await interaction.response.send_message("This giveaway data seems to be missing :/", ephemeral=True)
         prize = g['prize']
@@ -679,6 +827,61 @@ class GiveawayJoinView(discord.ui.View):
         await interaction.response.send_message(embed=view.get_embed(), view=view, ephemeral=True)
 
 
+class GiveawayJoinView(discord.ui.View):
+    def __init__(self, cog, giveaway_id: int):
+        super().__init__(timeout=None)
+        self.cog = cog
+        self.giveaway_id = giveaway_id
+
+        self.add_item(GiveawayJoinButton(cog, giveaway_id))
+        self.add_item(GiveawayListButton(cog, giveaway_id))
+
+
+class GiveawayHistoryView(PrivateView):
+    def __init__(self, cog, user, guild_id: int):
+        super().__init__(user, timeout=120)
+        self.cog = cog
+        self.guild_id = guild_id
+        self.cursors = [HISTORY_START]
+        self.rows = []
+        self.has_more = False
+
+    async def load_page(self):
+        self.rows, self.has_more = await self.cog.fetch_history_page(self.guild_id, self.cursors[-1])
+        self.prev_page.disabled = len(self.cursors) == 1
+        self.next_page.disabled = not self.has_more
+
+    def get_embed(self):
+        lines = []
+        for giveaway_id, prize, end_time, participant_count, winners in self.rows:
+            winner_text = ", ".join(f"<@{w}>" for w in winners) or "No winners"
+            lines.append(f"**{prize}** (`{giveaway_id}`)\nEnded <t:{end_time}:R> • {participant_count} participants"
+                         f" • {winner_text}")
+
+        embed = discord.Embed(
+            title="Giveaway History",
+            description="\n\n".join(lines) or "No ended giveaways found.",
+            color=discord.Color(0x8632e6)
+        )
+        embed.set_footer(text=f"Page {len(self.cursors)}")
+        return embed
+
+    @discord.ui.button(label="◀️", style=discord.ButtonStyle.gray)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+            await self.load_page()
+        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+
+    @discord.ui.button(label="▶️", style=discord.ButtonStyle.gray)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.has_more and self.rows:
+            last = self.rows[-1]
+            self.cursors.append((last[2], last[0]))
+            await self.load_page()
+        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+
+
 class TemplateHomepage(PrivateLayoutView):
     def __init__(self, cog, user):
         super().__init__(user, timeout=None)
@@ -707,12 +910,12 @@ class TemplateHomepage(PrivateLayoutView):
         self.add_item(container)
 
     async def browse_callback(self, interaction: discord.Interaction):
-        templates = await self.cog.fetch_templates(guild_id=interaction.guild.id, mode="browse")
-        view = BrowsePage(self.cog, self.user, templates, interaction.guild.id)
+        view = BrowsePage(self.cog, self.user, interaction.guild.id)
+        await view.refresh(recount=True)
         await interaction.response.send_message(view=view, ephemeral=True)
 
     async def mystuff_callback(self, interaction: discord.Interaction):
-        templates = await self.cog.fetch_templates(user_id=self.user.id, mode="mine")
+        templates = await self.cog.fetch_templates(self.user.id)
         view = MystuffPage(self.cog, self.user, templates)
         await interaction.response.send_message(view=view, ephemeral=True)
 
@@ -904,46 +1107,47 @@ class EditPage(PrivateLayoutView):
 
 
 class BrowsePage(PrivateLayoutView):
-    def __init__(self, cog, user, templates, guild_id, page=1, exclude_global=False):
+    def __init__(self, cog, user, guild_id, page=1, exclude_global=False):
         super().__init__(user, timeout=None)
         self.cog = cog
         self.user = user
-        self.templates = templates
         self.guild_id = guild_id
         self.page = page
         self.exclude_global = exclude_global
+        self.sort = "popular"
+        self.search_mode = None
+        self.search_query = None
         self.per_page = 5
-        self.filter_templates()
-        self.total_pages = (len(self.filtered_templates) - 1) // self.per_page + 1 if self.filtered_templates else 1
+        self.current = []
+        self.total = 0
+        self.total_pages = 1
+
+    async def refresh(self, recount: bool = False):
+        if recount:
+            self.total = await self.cog.count_templates(self.guild_id, self.exclude_global, self.search_mode,
+                                                        self.search_query)
+            self.total_pages = (self.total - 1) // self.per_page + 1 if self.total else 1
+        self.page = max(1, min(self.page, self.total_pages))
+        self.current = await self.cog.fetch_template_page(self.guild_id, self.page, self.per_page, self.sort,
+                                                          self.exclude_global, self.search_mode, self.search_query)
         self.build_layout()
 
-    def filter_templates(self):
-        self.filtered_templates = []
-        if self.exclude_global:
-            self.filtered_templates = [t for t in self.templates if t['creation_guild_id'] == self.guild_id]
-        else:
-            self.filtered_templates = self.templates
-
     def build_layout(self):
         self.clear_items()
         container = discord.ui.Container()
-        count_text = f"{len(self.filtered_templates)} Total Templates"
+        count_text = f"{self.total} Total Templates"
         if self.exclude_global:
-            count_text = f"{len(self.filtered_templates)} (Local Only)"
+            count_text = f"{self.total} (Local Only)"
 
         container.add_item((discord.ui.TextDisplay(f"## Browse — {count_text}")))
         container.add_item(discord.ui.TextDisplay(
             "Browse Giveaway templates here. Use the buttons and dropdowns below to search, or sort."))
         container.add_item(discord.ui.Separator())
 
-        start = (self.page - 1) * self.per_page
-        end = start + self.per_page
-        current = self.filtered_templates[start:end]
-
-        if not current:
+        if not self.current:
             container.add_item(discord.ui.TextDisplay("No templates found."))
 
-        for t in current:
+        for t in self.current:
             use_btn = discord.ui.Button(label="Use", style=discord.ButtonStyle.primary,
                                         custom_id=f"use:{t['template_id']}")
             use_btn.callback = self.create_use_callback(t)
@@ -1029,12 +1233,12 @@ class BrowsePage(PrivateLayoutView):
 
     async def prev_callback(self, interaction: discord.Interaction):
         self.page -= 1
-        self.build_layout()
+        await self.refresh()
         await interaction.response.edit_message(view=self)
 
     async def next_callback(self, interaction: discord.Interaction):
         self.page += 1
-        self.build_layout()
+        await self.refresh()
         await interaction.response.edit_message(view=self)
 
     async def goto_callback(self, interaction: discord.Interaction):
@@ -1043,25 +1247,16 @@ class BrowsePage(PrivateLayoutView):
     async def exclude_callback(self, interaction: discord.Interaction):
         self.exclude_global = not self.exclude_global
         self.page = 1
-        self.filter_templates()
-        self.total_pages = (len(self.filtered_templates) - 1) // self.per_page + 1 if self.filtered_templates else 1
-        self.build_layout()
+        await self.refresh(recount=True)
         await interaction.response.edit_message(view=self)
 
     async def sort_callback(self, interaction: discord.Interaction):
         val = interaction.data['values'][0]
-        if val == 'popular':
-            self.templates.sort(key=lambda x: x['usage_count'], reverse=True)
-        elif val == 'unpopular':
-            self.templates.sort(key=lambda x: x['usage_count'])
-        elif val == 'alpha':
-            self.templates.sort(key=lambda x: x['prize'].lower())
-        elif val == 'revalpha':
-            self.templates.sort(key=lambda x: x['prize'].lower(), reverse=True)
+        if val in TEMPLATE_SORTS:
+            self.sort = val
 
         self.page = 1
-        self.filter_templates()
-        self.build_layout()
+        await self.refresh()
         await interaction.response.edit_message(view=self)
 
     async def search_prize_callback(self, interaction: discord.Interaction):
@@ -1080,17 +1275,22 @@ class SearchModal(discord.ui.Modal):
         self.add_item(self.input)
 
     async def on_submit(self, interaction: discord.Interaction):
-        query = self.input.value.lower()
-        if self.mode == "prize":
-            self.parent_view.filtered_templates = [t for t in self.parent_view.templates if query in t['prize'].lower()]
-        else:
-            self.parent_view.filtered_templates = [t for t in self.parent_view.templates if
-                                                   query in t['template_id'].lower()]
+        query = self.input.value.strip().lower()
+        if self.mode == "id_direct":
+            t = await self.parent_view.cog.fetch_template(query, interaction.guild.id)
+            if not t:
+                return await interaction.response.send_message("I couldn't find a template with that ID.",
+                                                               ephemeral=True)
+            draft = self.parent_view.cog.template_to_draft(t, interaction.guild.id)
+            embed = self.parent_view.cog.create_giveaway_embed(draft)
+            view = GiveawayPreviewView(self.parent_view.cog, self.parent_view.user, draft)
+            await interaction.response.send_message(content="Loaded template!", embed=embed, view=view)
+            return await self.parent_view.cog.increment_usage(t['template_id'])
 
+        self.parent_view.search_mode = self.mode
+        self.parent_view.search_query = query
         self.parent_view.page = 1
-        self.parent_view.total_pages = (
-                                                   len(self.parent_view.filtered_templates) - 1) // self.parent_view.per_page + 1 if self.parent_view.filtered_templates else 1
-        self.parent_view.build_layout()
+        await self.parent_view.refresh(recount=True)
         await interaction.response.edit_message(view=self.parent_view)
 
 
@@ -1128,12 +1328,12 @@ class CreatewithtemplatePage(PrivateLayoutView):
             SearchModal("id_direct", self))
 
     async def browse_callback(self, interaction: discord.Interaction):
-        templates = await self.cog.fetch_templates(guild_id=interaction.guild.id, mode="browse")
-        view = BrowsePage(self.cog, self.user, templates, interaction.guild.id)
+        view = BrowsePage(self.cog, self.user, interaction.guild.id)
+        await view.refresh(recount=True)
         await interaction.response.send_message(view=view, ephemeral=True)
 
     async def my_callback(self, interaction: discord.Interaction):
-        templates = await self.cog.fetch_templates(user_id=self.user.id, mode="mine")
+        templates = await self.cog.fetch_templates(self.user.id)
         view = MystuffUse(self.cog, self.user, templates)
         await interaction.response.send_message(view=view, ephemeral=True)
 
@@ -1229,7 +1429,10 @@ class GoToPageModal(discord.ui.Modal):
             page_num = int(self.page_input.value)
             if 1 <= page_num <= self.total_pages:
                 self.parent_view.page = page_num
-                self.parent_view.build_layout()
+                if isinstance(self.parent_view, BrowsePage):
+                    await self.parent_view.refresh()
+                else:
+                    self.parent_view.build_layout()
                 await interaction.response.edit_message(view=self.parent_view)
             else:
                 await interaction.response.send_message(
@@ -1393,6 +1596,96 @@ class RejectReasonModal(discord.ui.Modal):
         await self.cog.handle_review(interaction, self.template_id, self.creator_id, False, self.reason.value)
 
 
+class ReviewQueueView(PrivateView):
+    def __init__(self, cog, user):
+        super().__init__(user, timeout=300)
+        self.cog = cog
+        self.cursors = [REVIEW_QUEUE_START]
+        self.rows = []
+        self.has_more = False
+        self.selected: List[str] = []
+
+        self.picker = discord.ui.Select(placeholder="Select templates (none = whole page)", min_values=0, row=0)
+        self.picker.callback = self.picker_callback
+        self.add_item(self.picker)
+
+    async def load_page(self):
+        self.rows, self.has_more = await self.cog.fetch_review_page(self.cursors[-1])
+        self.selected = []
+        self.picker.options = [
+            discord.SelectOption(label=f"{prize}"[:100], value=template_id, description=template_id)
+            for template_id, prize, _, _, _ in self.rows
+        ] or [discord.SelectOption(label="Nothing to review", value="none")]
+        self.picker.max_values = max(1, len(self.rows))
+        self.picker.disabled = not self.rows
+        self.prev_page.disabled = len(self.cursors) == 1
+        self.next_page.disabled = not self.has_more
+        self.accept_btn.disabled = self.reject_btn.disabled = not self.rows
+
+    def get_embed(self):
+        lines = []
+        for template_id, prize, creator_id, guild_id, submitted_at in self.rows:
+            lines.append(f"**{prize}** (`{template_id}`)\nBy <@{creator_id}> in `{guild_id}` • "
+                         f"submitted <t:{submitted_at}:R>")
+
+        embed = discord.Embed(
+            title="Template Review Queue",
+            description="\n\n".join(lines) or "The review queue is empty.",
+            color=discord.Color.gold()
+        )
+        embed.set_footer(text=f"Page {len(self.cursors)} • Accept/Reject applies to the selection, "
+                              f"or the whole page if nothing is selected")
+        return embed
+
+    def targets(self) -> List[str]:
+        return self.selected or [row[0] for row in self.rows]
+
+    async def apply(self, interaction: discord.Interaction, approved: bool, reason: str = None):
+        decided = await self.cog.decide_reviews(self.targets(), approved, interaction.user.id, reason)
+        await self.load_page()
+        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+        await interaction.followup.send(f"{'Approved' if approved else 'Rejected'} **{len(decided)}** template(s).",
+                                        ephemeral=True)
+
+    async def picker_callback(self, interaction: discord.Interaction):
+        self.selected = [v for v in self.picker.values if v != "none"]
+        await interaction.response.defer()
+
+    @discord.ui.button(label="Accept", style=discord.ButtonStyle.green, row=1)
+    async def accept_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.apply(interaction, True)
+
+    @discord.ui.button(label="Reject", style=discord.ButtonStyle.red, row=1)
+    async def reject_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(BatchRejectModal(self))
+
+    @discord.ui.button(label="◀️", style=discord.ButtonStyle.gray, row=2)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+            await self.load_page()
+        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+
+    @discord.ui.button(label="▶️", style=discord.ButtonStyle.gray, row=2)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.has_more and self.rows:
+            last = self.rows[-1]
+            self.cursors.append((last[4], last[0]))
+            await self.load_page()
+        await interaction.response.edit_message(embed=self.get_embed(), view=self)
+
+
+class BatchRejectModal(discord.ui.Modal):
+    def __init__(self, queue_view: ReviewQueueView):
+        super().__init__(title=f"Reject {len(queue_view.targets())} Template(s)")
+        self.queue_view = queue_view
+        self.reason = discord.ui.TextInput(label="Reason", style=discord.TextStyle.paragraph)
+        self.add_item(self.reason)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await self.queue_view.apply(interaction, False, self.reason.value)
+
+
 class DestructiveConfirmationViewOld(PrivateLayoutView):
     def __init__(self, title_text: str, body_text: str, color: discord.Color = None):
         super().__init__(None, timeout=30)
@@ -1498,21 +1791,42 @@ class Giveaways(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.giveaway_cache: Dict[int, dict] = {}
-        self.participant_cache: Dict[int, Set[int]] = {}
+        self.participant_cache: Dict[int, ParticipantSet] = {}
         self.db_pool: Optional[asyncio.Queue[aiosqlite.Connection]] = None
+        self._end_semaphore = asyncio.Semaphore(5)
+        self._channel_locks: Dict[int, asyncio.Lock] = {}
+        self._channel_lock_users: Dict[int, int] = {}
+        self._ending: Set[int] = set()
+        self._join_locks: Dict[int, asyncio.Lock] = {}
+        self._recent_toggles: Dict[tuple, float] = {}
+        self.join_stats = {"toggles": 0, "contended": 0, "deduplicated": 0}
+        self._pending_usage: Dict[str, int] = {}
+        self._ranking_dirty = False
+        self.role_service = RoleGrantService()
+        self._next_start_at: Optional[int] = None
         self.check_giveaways.start()
 
     async def cog_load(self):
         await self.init_pools()
         await self.init_db()
         await self.populate_caches()
-        for giveaway_id in self.giveaway_cache:
-            self.bot.add_view(GiveawayJoinView(self, giveaway_id))
+        self.bot.add_dynamic_items(GiveawayJoinButton, GiveawayListButton)
+        if not self.archive_loop.is_running():
+            self.archive_loop.start()
+        if not self.usage_flush_loop.is_running():
+            self.usage_flush_loop.start()
+        if not self.join_stats_loop.is_running():
+            self.join_stats_loop.start()
 
     async def cog_unload(self):
         self.check_giveaways.cancel()
+        self.archive_loop.cancel()
+        self.usage_flush_loop.cancel()
+        self.join_stats_loop.cancel()
+        self.bot.remove_dynamic_items(GiveawayJoinButton, GiveawayListButton)
 
         if self.db_pool is not None:
+            await self.flush_usage()
             closing_tasks = []
             while not self.db_pool.empty():
                 conn = await self.db_pool.get()
@@ -1532,6 +1846,7 @@ class Giveaways(commands.Cog):
                 await conn.execute("PRAGMA busy_timeout=5000")
                 await conn.execute("PRAGMA journal_mode=WAL")
                 await conn.execute("PRAGMA synchronous = NORMAL")
+                await conn.execute("PRAGMA recursive_triggers = ON")
                 await conn.commit()
                 await self.db_pool.put(conn)
 
@@ -1567,6 +1882,12 @@ class Giveaways(commands.Cog):
                     PRIMARY KEY (guild_id, giveaway_id)
                 )
             ''')
+            for column in ("min_account_age", "min_server_age"):
+                try:
+                    await db.execute(f"ALTER TABLE giveaways ADD COLUMN {column} INTEGER DEFAULT 0")
+                except Exception:
+                    pass
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_giveaways_active_end ON giveaways(ended, end_time)")
 
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS giveaway_participants (
@@ -1576,14 +1897,87 @@ class Giveaways(commands.Cog):
                     PRIMARY KEY (guild_id, giveaway_id, user_id)
                 )
             ''')
+            try:
+                await db.execute("ALTER TABLE giveaways ADD COLUMN participant_count INTEGER")
+                await db.execute('''
+                    UPDATE giveaways SET participant_count = (
+                        SELECT COUNT(*) FROM giveaway_participants p
+                        WHERE p.guild_id = giveaways.guild_id AND p.giveaway_id = giveaways.giveaway_id
+                    ) WHERE ended = 1
+                ''')
+            except Exception:
+                pass
 
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS giveaway_winners (
                     giveaway_id INTEGER,
                     user_id INTEGER,
+                    guild_id INTEGER,
                     PRIMARY KEY (giveaway_id, user_id)
                 )
             ''')
+            try:
+                await db.execute("ALTER TABLE giveaway_winners ADD COLUMN guild_id INTEGER")
+                await db.execute('''
+                    UPDATE giveaway_winners SET guild_id = (
+                        SELECT guild_id FROM giveaways g WHERE g.giveaway_id = giveaway_winners.giveaway_id
+                    ) WHERE guild_id IS NULL
+                ''')
+            except Exception:
+                pass
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_giveaway_winners_guild ON giveaway_winners(guild_id, giveaway_id)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_giveaways_guild_end ON giveaways(guild_id, end_time)")
+
+            await db.execute('''
+                CREATE TABLE IF NOT EXISTS scheduled_giveaways (
+                    schedule_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER,
+                    channel_id INTEGER,
+                    start_time INTEGER,
+                    draft TEXT,
+                    failed INTEGER DEFAULT 0,
+                    created_by INTEGER
+                )
+            ''')
+            for column in ("failed INTEGER DEFAULT 0", "created_by INTEGER"):
+                try:
+                    await db.execute(f"ALTER TABLE scheduled_giveaways ADD COLUMN {column}")
+                except Exception:
+                    pass
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scheduled_giveaways_start ON scheduled_giveaways(start_time)")
+
+            await db.execute('''
+                CREATE TABLE IF NOT EXISTS giveaway_archive (
+                    guild_id INTEGER,
+                    giveaway_id INTEGER,
+                    channel_id INTEGER,
+                    prize TEXT,
+                    winners_count INTEGER,
+                    end_time INTEGER,
+                    host_id INTEGER,
+                    winner_role_id INTEGER,
+                    participant_count INTEGER,
+                    participants BLOB,
+                    archived_at INTEGER,
+                    extra_entry_roles TEXT,
+                    PRIMARY KEY (guild_id, giveaway_id)
+                )
+            ''')
+            try:
+                await db.execute("ALTER TABLE giveaway_archive ADD COLUMN extra_entry_roles TEXT")
+            except Exception:
+                pass
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_giveaway_archive_guild_end ON giveaway_archive(guild_id, end_time)")
+
+            async with db.execute("PRAGMA auto_vacuum") as cursor:
+                auto_vacuum = (await cursor.fetchone())[0]
+            if auto_vacuum != 2:
+                await db.commit()
+                await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                await db.execute("VACUUM")
 
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS templates (
@@ -1609,6 +2003,91 @@ class Giveaways(commands.Cog):
                 )
             ''')
 
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_templates_published ON templates(is_published, usage_count)")
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_templates_guild ON templates(creation_guild_id, usage_count)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_templates_creator ON templates(creator_id, usage_count)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_templates_prize ON templates(prize COLLATE NOCASE)")
+            try:
+                await db.execute("ALTER TABLE templates ADD COLUMN popularity_rank INTEGER DEFAULT 2147483647")
+                self._ranking_dirty = True
+            except Exception:
+                pass
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_templates_published_rank ON templates(is_published, popularity_rank)")
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_templates_guild_rank ON templates(creation_guild_id, popularity_rank)")
+
+            async with db.execute("SELECT 1 FROM sqlite_master WHERE name = 'templates_fts'") as cursor:
+                fts_exists = await cursor.fetchone()
+            if not fts_exists:
+                await db.executescript('''
+                    CREATE VIRTUAL TABLE templates_fts USING fts5(prize, content='templates', content_rowid='rowid');
+                    CREATE TRIGGER templates_fts_ai AFTER INSERT ON templates BEGIN
+                        INSERT INTO templates_fts(rowid, prize) VALUES (new.rowid, new.prize);
+                    END;
+                    CREATE TRIGGER templates_fts_ad AFTER DELETE ON templates BEGIN
+                        INSERT INTO templates_fts(templates_fts, rowid, prize) VALUES ('delete', old.rowid, old.prize);
+                    END;
+                    CREATE TRIGGER templates_fts_au AFTER UPDATE OF prize ON templates BEGIN
+                        INSERT INTO templates_fts(templates_fts, rowid, prize) VALUES ('delete', old.rowid, old.prize);
+                        INSERT INTO templates_fts(rowid, prize) VALUES (new.rowid, new.prize);
+                    END;
+                    INSERT INTO templates_fts(templates_fts) VALUES ('rebuild');
+                ''')
+
+            async with db.execute("SELECT 1 FROM sqlite_master WHERE name = 'giveaway_stats'") as cursor:
+                stats_exist = await cursor.fetchone()
+            if not stats_exist:
+                await db.executescript('''
+                    CREATE TABLE giveaway_stats (
+                        guild_id INTEGER PRIMARY KEY,
+                        giveaways_run INTEGER DEFAULT 0,
+                        total_entries INTEGER DEFAULT 0,
+                        unique_entrants INTEGER DEFAULT 0
+                    );
+                    CREATE TABLE giveaway_host_stats (
+                        guild_id INTEGER,
+                        host_id INTEGER,
+                        giveaways INTEGER DEFAULT 0,
+                        PRIMARY KEY (guild_id, host_id)
+                    );
+                    CREATE INDEX idx_giveaway_host_stats_top ON giveaway_host_stats(guild_id, giveaways);
+                    CREATE TABLE giveaway_hour_stats (
+                        guild_id INTEGER,
+                        hour INTEGER,
+                        giveaways INTEGER DEFAULT 0,
+                        entries INTEGER DEFAULT 0,
+                        PRIMARY KEY (guild_id, hour)
+                    );
+                    CREATE TABLE giveaway_entrants_seen (
+                        guild_id INTEGER,
+                        user_id INTEGER,
+                        PRIMARY KEY (guild_id, user_id)
+                    ) WITHOUT ROWID;
+                ''')
+                await self.backfill_stats(db)
+
+            async with db.execute("SELECT 1 FROM sqlite_master WHERE name = 'template_reviews'") as cursor:
+                reviews_exist = await cursor.fetchone()
+            if not reviews_exist:
+                await db.executescript('''
+                    CREATE TABLE template_reviews (
+                        template_id TEXT PRIMARY KEY,
+                        creator_id INTEGER,
+                        guild_id INTEGER,
+                        submitted_at INTEGER,
+                        status TEXT DEFAULT 'pending',
+                        reviewer_id INTEGER,
+                        reason TEXT,
+                        decided_at INTEGER
+                    );
+                    CREATE INDEX idx_template_reviews_status ON template_reviews(status, submitted_at, template_id);
+                    INSERT INTO template_reviews (template_id, creator_id, guild_id, submitted_at)
+                    SELECT template_id, creator_id, creation_guild_id, CAST(strftime('%s', 'now') AS INTEGER)
+                    FROM templates WHERE review_status = 'pending';
+                ''')
+
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS review_config (
                     guild_id INTEGER PRIMARY KEY,
@@ -1630,29 +2109,355 @@ class Giveaways(commands.Cog):
                     data = dict(zip(columns, row))
                     giveaway_id = data["giveaway_id"]
                     self.giveaway_cache[giveaway_id] = data
-                    self.participant_cache[giveaway_id] = set()
 
-            if self.giveaway_cache:
-                placeholders = ", ".join(['?'] * len(self.giveaway_cache))
+            loaded: Dict[int, List[int]] = {giveaway_id: [] for giveaway_id in self.giveaway_cache}
+            if loaded:
+                placeholders = ", ".join(['?'] * len(loaded))
                 query = f"SELECT giveaway_id, user_id FROM giveaway_participants WHERE giveaway_id in ({placeholders})"
-                async with db.execute(query, list(self.giveaway_cache.keys())) as cursor:
-                    participant_rows = await cursor.fetchall()
-                    for giveaway_id, user_id in participant_rows:
-                        if giveaway_id in self.participant_cache:
-                            self.participant_cache[giveaway_id].add(user_id)
+                async with db.execute(query, list(loaded.keys())) as cursor:
+                    async for giveaway_id, user_id in cursor:
+                        if giveaway_id in loaded:
+                            loaded[giveaway_id].append(user_id)
+
+            for giveaway_id, user_ids in loaded.items():
+                self.participant_cache[giveaway_id] = ParticipantSet(user_ids)
+
+            async with db.execute("SELECT MIN(start_time) FROM scheduled_giveaways WHERE failed < ?",
+                                  (SCHEDULE_MAX_ATTEMPTS,)) as cursor:
+                self._next_start_at = (await cursor.fetchone())[0]
 
     @tasks.loop(seconds=10)
     async def check_giveaways(self):
         now = int(datetime.now(timezone.utc).timestamp())
 
         to_end = [
-            (g['giveaway_id'], g['guild_id'])
+            (g['giveaway_id'], g['guild_id'], g['channel_id'])
             for g in self.giveaway_cache.values()
             if g['end_time'] <= now and g['ended'] == 0
         ]
 
-        for giveaway_id, guild_id in to_end:
-            await self.end_giveaway(giveaway_id, guild_id)
+        if to_end:
+            await self.end_many(to_end)
+
+        if self._next_start_at is not None and self._next_start_at <= now:
+            await self.start_scheduled(now)
+
+    @check_giveaways.before_loop
+    async def before_check_giveaways(self):
+        await self.bot.wait_until_ready()
+        await self.catch_up_overdue()
+
+    async def catch_up_overdue(self):
+        now = int(datetime.now(timezone.utc).timestamp())
+        async with self.acquire_db() as db:
+            async with db.execute(
+                    "SELECT giveaway_id, guild_id, channel_id FROM giveaways WHERE ended = 0 AND end_time <= ? "
+                    "ORDER BY end_time", (now,)) as cursor:
+                overdue = await cursor.fetchall()
+
+        if overdue:
+            print(f"> Giveaways: catching up on {len(overdue)} overdue giveaway(s)")
+            await self.end_many(overdue, report_progress=True)
+
+    async def end_many(self, due: List[tuple], report_progress: bool = False):
+        due = [(giveaway_id, guild_id, channel_id) for giveaway_id, guild_id, channel_id in due
+               if giveaway_id not in self._ending]
+        total = len(due)
+        pending = [asyncio.create_task(self._end_bounded(*item)) for item in due]
+
+        for done, task in enumerate(asyncio.as_completed(pending), 1):
+            await task
+            if report_progress and (done % 10 == 0 or done == total):
+                print(f"> Giveaways: ended {done}/{total} overdue giveaway(s)")
+
+    async def _end_bounded(self, giveaway_id: int, guild_id: int, channel_id: int):
+        self._ending.add(giveaway_id)
+        lock = self._channel_locks.setdefault(channel_id, asyncio.Lock())
+        self._channel_lock_users[channel_id] = self._channel_lock_users.get(channel_id, 0) + 1
+        try:
+            async with lock:
+                async with self._end_semaphore:
+                    await self.end_giveaway(giveaway_id, guild_id)
+        except Exception as e:
+            print(f"Error ending giveaway {giveaway_id} in {guild_id}: {e}")
+        finally:
+            self._ending.discard(giveaway_id)
+            self._channel_lock_users[channel_id] -= 1
+            if not self._channel_lock_users[channel_id]:
+                del self._channel_lock_users[channel_id]
+                if not lock.locked():
+                    self._channel_locks.pop(channel_id, None)
+
+    @tasks.loop(hours=1)
+    async def archive_loop(self):
+        cutoff = int(datetime.now(timezone.utc).timestamp()) - ARCHIVE_AFTER_DAYS * 86400
+
+        while await self.archive_batch(cutoff) == ARCHIVE_BATCH_SIZE:
+            await asyncio.sleep(1)
+
+        async with self.acquire_db() as db:
+            async with db.execute("PRAGMA incremental_vacuum(1000)") as cursor:
+                await cursor.fetchall()
+
+    @archive_loop.before_loop
+    async def before_archive_loop(self):
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(seconds=USAGE_FLUSH_SECONDS)
+    async def usage_flush_loop(self):
+        await self.flush_usage()
+
+    @tasks.loop(hours=1)
+    async def join_stats_loop(self):
+        stats = self.join_stats
+        if stats["toggles"] or stats["deduplicated"]:
+            print(f"> Giveaways: {stats['toggles']} join toggle(s) in the last hour, "
+                  f"{stats['contended']} contended, {stats['deduplicated']} deduplicated")
+        self.join_stats = {"toggles": 0, "contended": 0, "deduplicated": 0}
+
+    async def flush_usage(self):
+        if not self._pending_usage and not self._ranking_dirty:
+            return
+
+        pending, self._pending_usage = self._pending_usage, {}
+        try:
+            async with self.acquire_db() as db:
+                await db.executemany("UPDATE templates SET usage_count = usage_count + ? WHERE template_id = ?",
+                                     [(count, template_id) for template_id, count in pending.items()])
+                await db.execute('''
+                    UPDATE templates SET popularity_rank = r.rank
+                    FROM (
+                        SELECT template_id, ROW_NUMBER() OVER (ORDER BY usage_count DESC, template_id) AS rank
+                        FROM templates
+                    ) AS r
+                    WHERE templates.template_id = r.template_id AND templates.popularity_rank IS NOT r.rank
+                ''')
+                await db.commit()
+            self._ranking_dirty = False
+        except Exception as e:
+            for template_id, count in pending.items():
+                self._pending_usage[template_id] = self._pending_usage.get(template_id, 0) + count
+            print(f"Error flushing template usage: {e}")
+
+    async def archive_batch(self, cutoff: int) -> int:
+        now = int(datetime.now(timezone.utc).timestamp())
+        async with self.acquire_db() as db:
+            async with db.execute(
+                    "SELECT guild_id, giveaway_id, channel_id, prize, winners_count, end_time, host_id, winner_role_id, "
+                    "extra_entry_roles FROM giveaways WHERE ended = 1 AND end_time <= ? ORDER BY end_time LIMIT ?",
+                    (cutoff, ARCHIVE_BATCH_SIZE)) as cursor:
+                rows = await cursor.fetchall()
+
+            for row in rows:
+                guild_id, giveaway_id = row[0], row[1]
+                async with db.execute(
+                        "SELECT user_id FROM giveaway_participants WHERE guild_id = ? AND giveaway_id = ? ORDER BY rowid",
+                        (guild_id, giveaway_id)) as cursor:
+                    user_ids = [r[0] for r in await cursor.fetchall()]
+
+                await db.execute(
+                    "INSERT OR REPLACE INTO giveaway_archive (guild_id, giveaway_id, channel_id, prize, winners_count, "
+                    "end_time, host_id, winner_role_id, extra_entry_roles, participant_count, participants, archived_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*row, len(user_ids), pack_participants(user_ids), now))
+                await db.execute("DELETE FROM giveaway_participants WHERE guild_id = ? AND giveaway_id = ?",
+                                 (guild_id, giveaway_id))
+                await db.execute("DELETE FROM giveaways WHERE guild_id = ? AND giveaway_id = ?",
+                                 (guild_id, giveaway_id))
+            await db.commit()
+        return len(rows)
+
+    async def backfill_stats(self, db: aiosqlite.Connection):
+        ended = '''
+            SELECT g.guild_id, g.host_id, g.end_time, COALESCE(g.participant_count, 0) AS entries
+            FROM giveaways g WHERE g.ended = 1
+            UNION ALL
+            SELECT guild_id, host_id, end_time, participant_count FROM giveaway_archive
+        '''
+        await db.execute(f"INSERT INTO giveaway_stats (guild_id, giveaways_run, total_entries) "
+                         f"SELECT guild_id, COUNT(*), SUM(entries) FROM ({ended}) GROUP BY guild_id")
+        await db.execute(f"INSERT INTO giveaway_host_stats (guild_id, host_id, giveaways) "
+                         f"SELECT guild_id, host_id, COUNT(*) FROM ({ended}) GROUP BY guild_id, host_id")
+        await db.execute(f"INSERT INTO giveaway_hour_stats (guild_id, hour, giveaways, entries) "
+                         f"SELECT guild_id, end_time / 3600 % 24, COUNT(*), SUM(entries) FROM ({ended}) "
+                         f"GROUP BY guild_id, end_time / 3600 % 24")
+
+        await db.execute('''
+            INSERT OR IGNORE INTO giveaway_entrants_seen (guild_id, user_id)
+            SELECT p.guild_id, p.user_id FROM giveaway_participants p
+            JOIN giveaways g ON g.giveaway_id = p.giveaway_id AND g.guild_id = p.guild_id
+            WHERE g.ended = 1
+        ''')
+        async with db.execute("SELECT guild_id, participants FROM giveaway_archive") as cursor:
+            async for guild_id, blob in cursor:
+                await db.executemany("INSERT OR IGNORE INTO giveaway_entrants_seen (guild_id, user_id) VALUES (?, ?)",
+                                     ((guild_id, uid) for uid in unpack_participants(blob)))
+        await db.execute('''
+            UPDATE giveaway_stats SET unique_entrants = (
+                SELECT COUNT(*) FROM giveaway_entrants_seen s WHERE s.guild_id = giveaway_stats.guild_id
+            )
+        ''')
+
+    async def record_stats(self, g: dict, participants: List[int]):
+        try:
+            guild_id = g['guild_id']
+            hour = g['end_time'] // 3600 % 24
+            async with self.acquire_db() as db:
+                before = db.total_changes
+                await db.executemany("INSERT OR IGNORE INTO giveaway_entrants_seen (guild_id, user_id) VALUES (?, ?)",
+                                     ((guild_id, uid) for uid in participants))
+                new_entrants = db.total_changes - before
+
+                await db.execute('''
+                    INSERT INTO giveaway_stats (guild_id, giveaways_run, total_entries, unique_entrants)
+                    VALUES (?, 1, ?, ?)
+                    ON CONFLICT(guild_id) DO UPDATE SET
+                        giveaways_run = giveaways_run + 1,
+                        total_entries = total_entries + excluded.total_entries,
+                        unique_entrants = unique_entrants + excluded.unique_entrants
+                ''', (guild_id, len(participants), new_entrants))
+                await db.execute('''
+                    INSERT INTO giveaway_host_stats (guild_id, host_id, giveaways) VALUES (?, ?, 1)
+                    ON CONFLICT(guild_id, host_id) DO UPDATE SET giveaways = giveaways + 1
+                ''', (guild_id, g['host_id']))
+                await db.execute('''
+                    INSERT INTO giveaway_hour_stats (guild_id, hour, giveaways, entries) VALUES (?, ?, 1, ?)
+                    ON CONFLICT(guild_id, hour) DO UPDATE SET
+                        giveaways = giveaways + 1,
+                        entries = entries + excluded.entries
+                ''', (guild_id, hour, len(participants)))
+                await db.commit()
+        except Exception as e:
+            print(f"Error recording stats for giveaway {g['giveaway_id']}: {e}")
+
+    async def fetch_stats(self, guild_id: int) -> Optional[dict]:
+        async with self.acquire_db() as db:
+            async with db.execute("SELECT giveaways_run, total_entries, unique_entrants FROM giveaway_stats "
+                                  "WHERE guild_id = ?", (guild_id,)) as cursor:
+                row = await cursor.fetchone()
+            if not row:
+                return None
+            async with db.execute("SELECT host_id, giveaways FROM giveaway_host_stats WHERE guild_id = ? "
+                                  "ORDER BY giveaways DESC LIMIT 5", (guild_id,)) as cursor:
+                hosts = await cursor.fetchall()
+            async with db.execute("SELECT hour, giveaways, entries FROM giveaway_hour_stats WHERE guild_id = ? "
+                                  "ORDER BY entries DESC, giveaways DESC LIMIT 3", (guild_id,)) as cursor:
+                hours = await cursor.fetchall()
+
+        return {"giveaways_run": row[0], "total_entries": row[1], "unique_entrants": row[2],
+                "top_hosts": hosts, "busiest_hours": hours}
+
+    async def fetch_history_page(self, guild_id: int, before: tuple = HISTORY_START, limit: int = 10,
+                                 prize_filter: str = ""):
+        like = f"%{escape_like(prize_filter)}%"
+        query = '''
+            SELECT * FROM (
+                SELECT g.giveaway_id, g.prize, g.end_time, COALESCE(g.participant_count, 0)
+                FROM giveaways g
+                WHERE g.guild_id = ? AND g.ended = 1 AND (g.end_time, g.giveaway_id) < (?, ?) AND g.prize LIKE ? ESCAPE '\\'
+                ORDER BY g.end_time DESC, g.giveaway_id DESC LIMIT ?
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT giveaway_id, prize, end_time, participant_count
+                FROM giveaway_archive
+                WHERE guild_id = ? AND (end_time, giveaway_id) < (?, ?) AND prize LIKE ? ESCAPE '\\'
+                ORDER BY end_time DESC, giveaway_id DESC LIMIT ?
+            )
+            ORDER BY 3 DESC, 1 DESC LIMIT ?
+        '''
+        args = (guild_id, before[0], before[1], like, limit + 1,
+                guild_id, before[0], before[1], like, limit + 1, limit + 1)
+
+        async with self.acquire_db() as db:
+            async with db.execute(query, args) as cursor:
+                rows = await cursor.fetchall()
+
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            winners: Dict[int, List[int]] = {row[0]: [] for row in rows}
+            if winners:
+                placeholders = ", ".join(["?"] * len(winners))
+                async with db.execute(
+                        f"SELECT giveaway_id, user_id FROM giveaway_winners WHERE guild_id = ? AND giveaway_id IN ({placeholders})",
+                        (guild_id, *winners.keys())) as cursor:
+                    async for giveaway_id, user_id in cursor:
+                        winners[giveaway_id].append(user_id)
+
+        return [(*row, winners[row[0]]) for row in rows], has_more
+
+    async def export_giveaway(self, guild: discord.Guild, giveaway_id: int, path: str) -> bool:
+        conn = await aiosqlite.connect(GDB_PATH, timeout=5)
+        try:
+            await conn.execute("BEGIN")
+            async with conn.execute(
+                    "SELECT extra_entry_roles FROM giveaways WHERE guild_id = ? AND giveaway_id = ?",
+                    (guild.id, giveaway_id)) as cursor:
+                live = await cursor.fetchone()
+            archived = None
+            if not live:
+                async with conn.execute(
+                        "SELECT extra_entry_roles, participants FROM giveaway_archive "
+                        "WHERE guild_id = ? AND giveaway_id = ?",
+                        (guild.id, giveaway_id)) as cursor:
+                    archived = await cursor.fetchone()
+                if not archived:
+                    return False
+
+            extra_roles_str = (live or archived)[0]
+            extra_roles = {int(r) for r in extra_roles_str.split(",")} if extra_roles_str else set()
+
+            def entries_for(user_id: int) -> int:
+                member = guild.get_member(user_id) if extra_roles else None
+                if not member:
+                    return 1
+                return 1 + sum(1 for r in member.roles if r.id in extra_roles)
+
+            with gzip.open(path, "wt", newline="", encoding="utf-8") as fh:
+                writer = csv.writer(fh)
+                writer.writerow(["type", "user_id", "entries", "join_order"])
+
+                join_order = 0
+                if archived:
+                    user_ids = unpack_participants(archived[1])
+                    for start in range(0, len(user_ids), EXPORT_CHUNK_SIZE):
+                        for user_id in user_ids[start:start + EXPORT_CHUNK_SIZE]:
+                            join_order += 1
+                            writer.writerow(["participant", user_id, entries_for(user_id), join_order])
+                        await asyncio.sleep(0)
+                else:
+                    async with conn.execute(
+                            "SELECT user_id FROM giveaway_participants WHERE guild_id = ? AND giveaway_id = ? ORDER BY rowid",
+                            (guild.id, giveaway_id)) as cursor:
+                        while rows := await cursor.fetchmany(EXPORT_CHUNK_SIZE):
+                            for (user_id,) in rows:
+                                join_order += 1
+                                writer.writerow(["participant", user_id, entries_for(user_id), join_order])
+
+                async with conn.execute(
+                        "SELECT user_id FROM giveaway_winners WHERE guild_id = ? AND giveaway_id = ?",
+                        (guild.id, giveaway_id)) as cursor:
+                    while rows := await cursor.fetchmany(EXPORT_CHUNK_SIZE):
+                        for (user_id,) in rows:
+                            writer.writerow(["winner", user_id, "", ""])
+            return True
+        finally:
+            await conn.rollback()
+            await conn.close()
+
+    async def fetch_participant_snapshot(self, giveaway_id: int, guild_id: int) -> array:
+        async with self.acquire_db() as db:
+            async with db.execute(
+                    "SELECT participants FROM giveaway_archive WHERE guild_id = ? AND giveaway_id = ?",
+                    (guild_id, giveaway_id)) as cursor:
+                row = await cursor.fetchone()
+            if row:
+                return unpack_participants(row[0])
+
+            async with db.execute(
+                    "SELECT user_id FROM giveaway_participants WHERE guild_id = ? AND giveaway_id = ? ORDER BY rowid",
+                    (guild_id, giveaway_id)) as cursor:
+                return array("Q", [r[0] for r in await cursor.fetchall()])
 
     async def end_giveaway(self, giveaway_id: int, guild_id: int):
         g = self.giveaway_cache.get(giveaway_id)
@@ -1667,17 +2472,24 @@ class Giveaways(commands.Cog):
                     self.giveaway_cache[giveaway_id] = g
         if g.get('ended') == 1:
             return
-        whichone = "giveaway_cache"
-        await self.mark_as_ended(giveaway_id, guild_id, whichone)
+        async with self._join_locks.setdefault(giveaway_id, asyncio.Lock()):
+            whichone = "giveaway_cache"
+            await self.mark_as_ended(giveaway_id, guild_id, whichone)
 
-        raw_participants = list(self.participant_cache.get(giveaway_id, set()))
+            raw_participants = list(self.participant_cache.get(giveaway_id, ()))
 
-        if not raw_participants:
-            async with self.acquire_db() as db:
-                async with db.execute("SELECT user_id FROM giveaway_participants WHERE giveaway_id = ?",
-                                      (giveaway_id,)) as cursor:
-                    rows = await cursor.fetchall()
-                    raw_participants = [r[0] for r in rows]
+            if not raw_participants:
+                async with self.acquire_db() as db:
+                    async with db.execute("SELECT user_id FROM giveaway_participants WHERE giveaway_id = ?",
+                                          (giveaway_id,)) as cursor:
+                        rows = await cursor.fetchall()
+                        raw_participants = [r[0] for r in rows]
+
+        g['participant_count'] = len(raw_participants)
+        async with self.acquire_db() as db:
+            await db.execute("UPDATE giveaways SET participant_count = ? WHERE giveaway_id = ? AND guild_id = ?",
+                             (len(raw_participants), giveaway_id, guild_id))
+            await db.commit()
 
         pool = []
 
@@ -1707,6 +2519,7 @@ class Giveaways(commands.Cog):
                                                        description=f"Giveaway for **{g['prize']}** ended with no participants.",
                                                        colour=discord.Colour.red()))
             await self.mark_as_ended(giveaway_id, guild_id, 'participant_cache')
+            await self.record_stats(g, raw_participants)
             return
 
         winner_count = min(len(set(pool)), g['winners_count'])
@@ -1719,12 +2532,12 @@ class Giveaways(commands.Cog):
 
             if len(winners) == winner_count:
                 break
-        winner_data = [(giveaway_id, winner_id) for winner_id in winners]
+        winner_data = [(guild_id, giveaway_id, winner_id) for winner_id in winners]
 
         if winner_data:
             async with self.acquire_db() as db:
                 await db.executemany(
-                    "INSERT INTO giveaway_winners (giveaway_id, user_id) VALUES (?, ?)",
+                    "INSERT OR IGNORE INTO giveaway_winners (guild_id, giveaway_id, user_id) VALUES (?, ?, ?)",
                     winner_data
                 )
                 await db.commit()
@@ -1745,26 +2558,58 @@ class Giveaways(commands.Cog):
                 winner_role_id = g.get('winner_role_id')
                 if winner_role_id:
                     role = guild.get_role(winner_role_id)
-
-                    async def chunk_list(lst, n):
-                        for i in range(0, len(lst), n):
-                            yield lst[i:i + n]
-
                     if role:
-                        for chunk in chunk_list(winners, 5):
-                            for member_id in chunk:
-                                member = guild.get_member(member_id) or await guild.fetch_member(member_id)
-                                if member:
-                                    try:
-                                        await member.add_roles(role, reason="Giveaway Winner")
-                                    except discord.HTTPException:
-                                        pass
-
-                            await asyncio.sleep(1.5)
+                        result = await self.role_service.apply(guild, role, winners, reason="Giveaway Winner")
+                        if result.failed:
+                            await channel.send(f"⚠️ {result.summary()}",
+                                               allowed_mentions=discord.AllowedMentions.none())
 
             except Exception:
                 pass
 
+        await self.record_stats(g, raw_participants)
+
+    async def toggle_participant(self, guild_id: int, giveaway_id: int, user_id: int,
+                                 clicked_at: float) -> Optional[str]:
+        lock = self._join_locks.setdefault(giveaway_id, asyncio.Lock())
+        if lock.locked():
+            self.join_stats["contended"] += 1
+
+        async with lock:
+            g = self.giveaway_cache.get(giveaway_id)
+            if not g or g['ended'] == 1:
+                return None
+
+            participants = self.participant_cache.setdefault(giveaway_id, ParticipantSet())
+            key = (giveaway_id, user_id)
+            now = datetime.now(timezone.utc).timestamp()
+            # A click sent before this user's previous toggle was applied asked for the state they now have.
+            recent = self._recent_toggles.get(key)
+            if recent and clicked_at < recent:
+                self.join_stats["deduplicated"] += 1
+                return "duplicate"
+
+            async with self.acquire_db() as db:
+                if user_id in participants:
+                    await db.execute("DELETE FROM giveaway_participants WHERE giveaway_id = ? AND user_id = ?",
+                                     (giveaway_id, user_id))
+                    await db.commit()
+                    participants.discard(user_id)
+                    result = "left"
+                else:
+                    await db.execute("INSERT OR IGNORE INTO giveaway_participants (guild_id, giveaway_id, user_id) "
+                                     "VALUES (?, ?, ?)", (guild_id, giveaway_id, user_id))
+                    await db.commit()
+                    participants.add(user_id)
+                    result = "joined"
+
+            self.join_stats["toggles"] += 1
+            if len(self._recent_toggles) > 4096:
+                self._recent_toggles = {k: v for k, v in self._recent_toggles.items()
+                                        if now - v < JOIN_DEBOUNCE_SECONDS}
+            self._recent_toggles[key] = now
+            return result
+
     async def mark_as_ended(self, giveaway_id: int, guild_id: int, whichone: str):
         if whichone == 'giveaway_cache':
             if giveaway_id in self.giveaway_cache:
@@ -1776,6 +2621,7 @@ class Giveaways(commands.Cog):
         if whichone == 'participant_cache':
             if giveaway_id in self.participant_cache:
                 self.participant_cache.pop(giveaway_id, None)
+            self._join_locks.pop(giveaway_id, None)
 
     def create_embed_from_cache(self, row, winners=None):
         end_ts = row['end_time']
@@ -1803,6 +2649,8 @@ class Giveaways(commands.Cog):
                 pass
 
         time_display = f"Duration: **{draft.duration}**"
+        if draft.start_time and not preview_active_end:
+            time_display = f"Starts: **<t:{draft.start_time}:R>**\n{time_display}"
         if preview_active_end:
             time_display = f"Ends: **<t:{preview_active_end}:R>**"
 
@@ -1827,6 +2675,14 @@ class Giveaways(commands.Cog):
             mode = "all of the following" if draft.required_behaviour == 0 else "one of the following"
             embed.add_field(name="Requirements", value=f"Must have **{mode}**: {role_mentions}", inline=False)
 
+        age_rules = []
+        if draft.min_account_age:
+            age_rules.append(f"Account at least **{format_seconds_to_duration(draft.min_account_age)}** old")
+        if draft.min_server_age:
+            age_rules.append(f"In the server for at least **{format_seconds_to_duration(draft.min_server_age)}**")
+        if age_rules:
+            embed.add_field(name="Eligibility", value="\n".join(age_rules), inline=False)
+
         if draft.image:
             embed.set_image(url=draft.image)
         if draft.thumbnail:
@@ -1858,11 +2714,13 @@ class Giveaways(commands.Cog):
             "image_url": draft.image,
             "thumbnail_url": draft.thumbnail,
             "color": draft.color,
+            "min_account_age": draft.min_account_age,
+            "min_server_age": draft.min_server_age,
             "ended": 0
         }
 
         self.giveaway_cache[giveaway_id] = data
-        self.participant_cache[giveaway_id] = set()
+        self.participant_cache[giveaway_id] = ParticipantSet()
 
         async with self.acquire_db() as db:
             placeholders = ", ".join(["?"] * len(data))
@@ -1871,29 +2729,170 @@ class Giveaways(commands.Cog):
                              tuple(data.values()))
             await db.commit()
 
-    async def fetch_templates(self, guild_id: int = None, user_id: int = None, mode: str = "browse"):
+    async def launch_giveaway(self, draft: GiveawayDraft):
+        channel = self.bot.get_channel(draft.channel_id)
+        if not channel:
+            try:
+                channel = await self.bot.fetch_channel(draft.channel_id)
+            except (discord.Forbidden, discord.NotFound):
+                return None, None
+
+        giveaway_id = int(discord.utils.utcnow().timestamp()) + random.randint(1, 69)
+
+        seconds = get_duration_to_seconds(draft.duration)
+        end_time = get_now_plus_seconds_unix(seconds)
+
+        embed = self.create_giveaway_embed(draft, preview_active_end=end_time)
+        embed.set_footer(text=f"ID: {giveaway_id}")
+        msg = await channel.send(embed=embed, view=GiveawayJoinView(self, giveaway_id))
+
+        await self.save_giveaway(draft, msg.id, giveaway_id, end_time)
+        return channel, giveaway_id
+
+    async def schedule_giveaway(self, draft: GiveawayDraft, created_by: int):
         async with self.acquire_db() as db:
-            if mode == "mine":
-                query = "SELECT * FROM templates WHERE creator_id = ? ORDER BY usage_count DESC"
-                args = (user_id,)
-            else:
-                query = "SELECT * FROM templates WHERE is_published = 1 OR creation_guild_id = ?"
-                args = (guild_id,)
+            await db.execute(
+                "INSERT INTO scheduled_giveaways (guild_id, channel_id, start_time, draft, created_by) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (draft.guild_id, draft.channel_id, draft.start_time, json.dumps(asdict(draft)), created_by))
+            await db.commit()
 
-            db.row_factory = aiosqlite.Row
-            async with db.execute(query, args) as cursor:
+        if self._next_start_at is None or draft.start_time < self._next_start_at:
+            self._next_start_at = draft.start_time
+
+    async def start_scheduled(self, now: int):
+        async with self.acquire_db() as db:
+            async with db.execute(
+                    "SELECT schedule_id, draft, created_by, failed FROM scheduled_giveaways "
+                    "WHERE start_time <= ? AND failed < ? ORDER BY start_time",
+                    (now, SCHEDULE_MAX_ATTEMPTS)) as cursor:
+                due = await cursor.fetchall()
+
+        for schedule_id, raw, created_by, attempts in due:
+            draft = GiveawayDraft(**json.loads(raw))
+            draft.start_time = None
+            try:
+                channel, _ = await self.launch_giveaway(draft)
+                if not channel:
+                    print(f"Scheduled giveaway {schedule_id} could not find channel {draft.channel_id}")
+            except Exception as e:
+                channel = None
+                print(f"Error starting scheduled giveaway {schedule_id}: {e}")
+
+            retry_at = now + SCHEDULE_RETRY_SECONDS if attempts + 1 < SCHEDULE_MAX_ATTEMPTS else None
+            async with self.acquire_db() as db:
+                if channel:
+                    await db.execute("DELETE FROM scheduled_giveaways WHERE schedule_id = ?", (schedule_id,))
+                else:
+                    await db.execute("UPDATE scheduled_giveaways SET failed = failed + 1, "
+                                     "start_time = COALESCE(?, start_time) WHERE schedule_id = ?",
+                                     (retry_at, schedule_id))
+                await db.commit()
+
+            if not channel:
+                await self.notify_schedule_failure(draft, created_by or draft.host_id, retry_at)
+
+        async with self.acquire_db() as db:
+            async with db.execute("SELECT MIN(start_time) FROM scheduled_giveaways WHERE failed < ?",
+                                  (SCHEDULE_MAX_ATTEMPTS,)) as cursor:
+                self._next_start_at = (await cursor.fetchone())[0]
+
+    async def notify_schedule_failure(self, draft: GiveawayDraft, user_id: Optional[int], retry_at: Optional[int]):
+        user = self.bot.get_user(user_id) if user_id else None
+        if not user:
+            return
+        embed = discord.Embed(title="Scheduled Giveaway Failed to Start", color=discord.Color.red())
+        if retry_at:
+            embed.description = (f"I couldn't start the giveaway for **{draft.prize}** in <#{draft.channel_id}>. "
+                                 f"I'll try again **<t:{retry_at}:R>**.")
+        else:
+            embed.description = (f"I couldn't start the giveaway for **{draft.prize}** in <#{draft.channel_id}> "
+                                 f"after {SCHEDULE_MAX_ATTEMPTS} attempts, so I've stopped trying.\n\n"
+                                 f"Ensure that I have the necessary permissions in that channel, then use "
+                                 f"`/giveaway scheduled` to cancel it and schedule it again.")
+        try:
+            await user.send(embed=embed)
+        except discord.HTTPException:
+            pass
+
+    async def fetch_scheduled(self, guild_id: int) -> List[tuple]:
+        async with self.acquire_db() as db:
+            async with db.execute("SELECT schedule_id, channel_id, start_time, draft, created_by, failed "
+                                  "FROM scheduled_giveaways WHERE guild_id = ? ORDER BY start_time",
+                                  (guild_id,)) as cursor:
+                return await cursor.fetchall()
+
+    async def cancel_scheduled(self, schedule_id: int, guild_id: int) -> bool:
+        async with self.acquire_db() as db:
+            cursor = await db.execute("DELETE FROM scheduled_giveaways WHERE schedule_id = ? AND guild_id = ?",
+                                      (schedule_id, guild_id))
+            await db.commit()
+            removed = cursor.rowcount > 0
+            async with db.execute("SELECT MIN(start_time) FROM scheduled_giveaways WHERE failed < ?",
+                                  (SCHEDULE_MAX_ATTEMPTS,)) as cursor:
+                self._next_start_at = (await cursor.fetchone())[0]
+        return removed
+
+    async def fetch_templates(self, user_id: int):
+        async with self.acquire_db() as db:
+            async with db.execute("SELECT * FROM templates WHERE creator_id = ? ORDER BY usage_count DESC",
+                                  (user_id,)) as cursor:
+                columns = [c[0] for c in cursor.description]
+                return [dict(zip(columns, row)) for row in await cursor.fetchall()]
+
+    async def fetch_template(self, template_id: str, guild_id: int):
+        async with self.acquire_db() as db:
+            async with db.execute(
+                    "SELECT * FROM templates WHERE template_id = ? AND (is_published = 1 OR creation_guild_id = ?)",
+                    (template_id, guild_id)) as cursor:
+                row = await cursor.fetchone()
+                if not row:
+                    return None
+                return dict(zip([c[0] for c in cursor.description], row))
+
+    def _template_filter(self, guild_id: int, local_only: bool, search_mode: Optional[str], query: Optional[str]):
+        clauses = ["creation_guild_id = ?" if local_only else "(is_published = 1 OR creation_guild_id = ?)"]
+        args = [guild_id]
+
+        if search_mode == "prize" and query is not None:
+            clauses.append("rowid IN (SELECT rowid FROM templates_fts WHERE templates_fts MATCH ?)")
+            args.append(build_fts_query(query))
+        elif search_mode == "id" and query is not None:
+            clauses.append("template_id LIKE ? ESCAPE '\\'")
+            args.append(f"%{escape_like(query)}%")
+
+        return " AND ".join(clauses), args
+
+    async def count_templates(self, guild_id: int, local_only: bool = False, search_mode: Optional[str] = None,
+                              query: Optional[str] = None) -> int:
+        where, args = self._template_filter(guild_id, local_only, search_mode, query)
+        async with self.acquire_db() as db:
+            async with db.execute(f"SELECT COUNT(*) FROM templates WHERE {where}", args) as cursor:
+                row = await cursor.fetchone()
+        return row[0] if row else 0
+
+    async def fetch_template_page(self, guild_id: int, page: int, per_page: int, sort: str = "popular",
+                                  local_only: bool = False, search_mode: Optional[str] = None,
+                                  query: Optional[str] = None):
+        where, args = self._template_filter(guild_id, local_only, search_mode, query)
+        order = TEMPLATE_SORTS.get(sort, TEMPLATE_SORTS["popular"])
+        args += [per_page, (page - 1) * per_page]
+
+        async with self.acquire_db() as db:
+            async with db.execute(f"SELECT * FROM templates WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                                  args) as cursor:
+                columns = [c[0] for c in cursor.description]
                 rows = await cursor.fetchall()
 
-            results = []
-            for row in rows:
-                t = dict(row)
-                if mode == "browse":
-                    creator = self.bot.get_user(t['creator_id'])
-                    t['creator_name'] = f"{creator.display_name} ({creator.name})" if creator else "Unknown"
-                    guild = self.bot.get_guild(t['creation_guild_id'])
-                    t['guild_name'] = guild.name if guild else "Unknown Guild"
-                results.append(t)
-            return results
+        results = []
+        for row in rows:
+            t = dict(zip(columns, row))
+            creator = self.bot.get_user(t['creator_id'])
+            t['creator_name'] = f"{creator.display_name} ({creator.name})" if creator else "Unknown"
+            guild = self.bot.get_guild(t['creation_guild_id'])
+            t['guild_name'] = guild.name if guild else "Unknown Guild"
+            results.append(t)
+        return results
 
     async def save_template(self, interaction: discord.Interaction, draft: GiveawayDraft):
         template_id = getattr(draft, 'template_id', None)
@@ -1925,17 +2924,20 @@ class Giveaways(commands.Cog):
 
         async with self.acquire_db() as db:
             async with db.execute(
-                    "SELECT usage_count, is_published, review_status FROM templates WHERE template_id = ?",
-                    (template_id,)) as cursor:
+                    "SELECT usage_count, is_published, review_status, popularity_rank FROM templates "
+                    "WHERE template_id = ?", (template_id,)) as cursor:
                 existing = await cursor.fetchone()
 
             if existing:
                 data['usage_count'] = existing[0]
                 data['is_published'] = existing[1]
                 data['review_status'] = existing[2]
+                data['popularity_rank'] = existing[3]
 
                 if data['is_published'] == 1:
                     await self.notify_review_channel_edit(data, interaction.guild.id)
+            else:
+                self._ranking_dirty = True
 
             columns = ", ".join(data.keys())
             placeholders = ", ".join(["?"] * len(data))
@@ -1949,12 +2951,11 @@ class Giveaways(commands.Cog):
     async def delete_template(self, template_id: str):
         async with self.acquire_db() as db:
             await db.execute("DELETE FROM templates WHERE template_id = ?", (template_id,))
+            await db.execute("DELETE FROM template_reviews WHERE template_id = ?", (template_id,))
             await db.commit()
 
     async def increment_usage(self, template_id: str):
-        async with self.acquire_db() as db:
-            await db.execute("UPDATE templates SET usage_count = usage_count + 1 WHERE template_id = ?", (template_id,))
-            await db.commit()
+        self._pending_usage[template_id] = self._pending_usage.get(template_id, 0) + 1
 
     def template_to_draft(self, t: dict, current_guild_id: int) -> GiveawayDraft:
         is_same = t['creation_guild_id'] == current_guild_id
@@ -1987,6 +2988,15 @@ class Giveaways(commands.Cog):
         async with self.acquire_db() as db:
             await db.execute("UPDATE templates SET is_published = ?, review_status = ? WHERE template_id = ?",
                              (status, review, template_id))
+            if publish:
+                await db.execute('''
+                    INSERT OR REPLACE INTO template_reviews (template_id, creator_id, guild_id, submitted_at)
+                    VALUES (?, ?, ?, ?)
+                ''', (template_id, interaction.user.id, interaction.guild.id,
+                      int(datetime.now(timezone.utc).timestamp())))
+            else:
+                await db.execute("DELETE FROM template_reviews WHERE template_id = ? AND status = 'pending'",
+                                 (template_id,))
             await db.commit()
 
         if publish:
@@ -2033,25 +3043,68 @@ class Giveaways(commands.Cog):
 
     async def handle_review(self, interaction, template_id, creator_id, approved, reason=None):
         status = "approved" if approved else "rejected"
+        decided = await self.decide_reviews([template_id], approved, interaction.user.id, reason)
+        if not decided:
+            return await interaction.response.edit_message(content="This template has already been reviewed.",
+                                                           view=None)
+
+        await interaction.response.edit_message(content=f"Template {status} by {interaction.user.name}", view=None)
+
+    async def fetch_review_page(self, after: tuple = REVIEW_QUEUE_START, limit: int = 10):
+        async with self.acquire_db() as db:
+            async with db.execute('''
+                SELECT r.template_id, t.prize, r.creator_id, r.guild_id, r.submitted_at
+                FROM template_reviews r JOIN templates t ON t.template_id = r.template_id
+                WHERE r.status = 'pending' AND (r.submitted_at, r.template_id) > (?, ?)
+                ORDER BY r.submitted_at, r.template_id
+                LIMIT ?
+            ''', (*after, limit + 1)) as cursor:
+                rows = await cursor.fetchall()
+        return rows[:limit], len(rows) > limit
+
+    async def decide_reviews(self, template_ids: List[str], approved: bool, reviewer_id: int,
+                             reason: str = None) -> List[tuple]:
+        if not template_ids:
+            return []
+        status = "approved" if approved else "rejected"
+        marks = ", ".join("?" * len(template_ids))
+
         async with self.acquire_db() as db:
-            await db.execute("UPDATE templates SET review_status = ? WHERE template_id = ?", (status, template_id))
-            if not approved:
-                await db.execute("UPDATE templates SET is_published = 0 WHERE template_id = ?", (template_id,))
+            async with db.execute(f"SELECT template_id, creator_id FROM template_reviews "
+                                  f"WHERE status = 'pending' AND template_id IN ({marks})", template_ids) as cursor:
+                decided = await cursor.fetchall()
+            if not decided:
+                return []
+
+            ids = [row[0] for row in decided]
+            marks = ", ".join("?" * len(ids))
+            await db.execute(f"UPDATE template_reviews SET status = ?, reviewer_id = ?, reason = ?, decided_at = ? "
+                             f"WHERE template_id IN ({marks})",
+                             (status, reviewer_id, reason, int(datetime.now(timezone.utc).timestamp()), *ids))
+            await db.execute(f"UPDATE templates SET review_status = ?, "
+                             f"is_published = CASE WHEN ? THEN is_published ELSE 0 END WHERE template_id IN ({marks})",
+                             (status, int(approved), *ids))
             await db.commit()
 
-        user = self.bot.get_user(creator_id)
-        if user:
+        semaphore = asyncio.Semaphore(5)
+
+        async def notify(template_id, creator_id):
+            user = self.bot.get_user(creator_id)
+            if not user:
+                return
             embed = discord.Embed(title=f"Template {status.title()}",
                                   color=discord.Color.green() if approved else discord.Color.red())
             embed.description = f"Your template **{template_id}** has been {status}."
             if not approved:
                 embed.add_field(name="Reason", value=reason or "No reason provided")
-            try:
-                await user.send(embed=embed)
-            except:
-                pass
+            async with semaphore:
+                try:
+                    await user.send(embed=embed)
+                except discord.HTTPException:
+                    pass
 
-        await interaction.response.edit_message(content=f"Template {status} by {interaction.user.name}", view=None)
+        await asyncio.gather(*(notify(template_id, creator_id) for template_id, creator_id in decided))
+        return decided
 
     async def giveaway_autocomplete(self, interaction: discord.Interaction, current: str, magic: bool = False):
         choices = []
@@ -2094,6 +3147,20 @@ class Giveaways(commands.Cog):
         await interaction.response.send_message(f"Set {interaction.channel.mention} as the review channel.",
                                                 ephemeral=True)
 
+    @app_commands.command(name="zq", description="Open the Template Review Queue.")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def review_queue(self, interaction: discord.Interaction):
+        async with self.acquire_db() as db:
+            async with db.execute("SELECT guild_id FROM review_config LIMIT 1") as cursor:
+                row = await cursor.fetchone()
+        if not row or row[0] != interaction.guild_id:
+            return await interaction.response.send_message("Reviews can only be done from the review server.",
+                                                           ephemeral=True)
+
+        view = ReviewQueueView(self, interaction.user)
+        await view.load_page()
+        await interaction.response.send_message(embed=view.get_embed(), view=view, ephemeral=True)
+
     @giveaway.command(name="end", description="End an active giveaway (winners are also picked and mentioned).")
     @app_commands.describe(giveaway_id="The ID of the giveaway to end.")
     async def giveaway_end(self, interaction: discord.Interaction, giveaway_id: str):
@@ -2129,34 +3196,33 @@ class Giveaways(commands.Cog):
             return await interaction.response.send_message("That is not a valid ID!", ephemeral=True)
 
         async with self.acquire_db() as db:
-            async with db.execute("SELECT prize FROM giveaways WHERE giveaway_id = ? and guild_id = ?",
-                                  (giveaway_id, interaction.guild.id,)) as cursor:
-                row = await cursor.fetchone()
-                prize = row[0] if row else "Unknown Prize"
             async with db.execute(
-                    "SELECT channel_id, message_id, prize FROM giveaways WHERE giveaway_id = ? AND guild_id = ?",
-                    (giveaway_id, interaction.guild.id,)) as cursor:
+                    "SELECT prize FROM giveaways WHERE giveaway_id = ? AND guild_id = ? "
+                    "UNION ALL SELECT prize FROM giveaway_archive WHERE giveaway_id = ? AND guild_id = ?",
+                    (giveaway_id, interaction.guild.id, giveaway_id, interaction.guild.id)) as cursor:
                 row = await cursor.fetchone()
 
-            if not row:
-                return await interaction.response.send_message("Giveaway not found.", ephemeral=True)
+        if not row:
+            return await interaction.response.send_message("Giveaway not found.", ephemeral=True)
+        prize = row[0]
 
-            body_content = f"Are you sure you want to delete the giveaway for **{prize}** (ID: {giveaway_id}) permanently?"
-            view = DestructiveConfirmationViewOld("Pending Confirmation", body_content)
-            response = await interaction.response.send_message(view=view)
-            view.message = await interaction.original_response()
-            await view.wait()
+        body_content = f"Are you sure you want to delete the giveaway for **{prize}** (ID: {giveaway_id}) permanently?"
+        view = DestructiveConfirmationViewOld("Pending Confirmation", body_content)
+        await interaction.response.send_message(view=view)
+        view.message = await interaction.original_response()
+        await view.wait()
 
-            if view.value is True:
-                async with self.acquire_db() as db:
-                    await db.execute("DELETE FROM giveaways WHERE giveaway_id = ?", (giveaway_id,))
-                    await db.execute("DELETE FROM giveaway_participants WHERE giveaway_id = ?", (giveaway_id,))
-                    await db.execute("DELETE FROM giveaway_winners WHERE giveaway_id = ?", (giveaway_id,))
-                    await db.commit()
-                    try:
-                        self.giveaway_cache.pop(giveaway_id)
-                    except Exception:
-                        pass
+        if view.value is True:
+            async with self.acquire_db() as db:
+                await db.execute("DELETE FROM giveaways WHERE giveaway_id = ? AND guild_id = ?",
+                                 (giveaway_id, interaction.guild.id))
+                await db.execute("DELETE FROM giveaway_archive WHERE giveaway_id = ? AND guild_id = ?",
+                                 (giveaway_id, interaction.guild.id))
+                await db.execute("DELETE FROM giveaway_participants WHERE giveaway_id = ?", (giveaway_id,))
+                await db.execute("DELETE FROM giveaway_winners WHERE giveaway_id = ?", (giveaway_id,))
+                await db.commit()
+            self.giveaway_cache.pop(giveaway_id, None)
+            self.participant_cache.pop(giveaway_id, None)
 
     @giveaway_delete.autocomplete("giveaway_id")
     async def delete_autocomplete(self, interaction: discord.Interaction, current: str):
@@ -2165,7 +3231,7 @@ class Giveaways(commands.Cog):
     @giveaway.command(name="reroll", description="Reroll a giveaway.")
     @app_commands.describe(giveaway_id="The ID of the giveaway to reroll.", winners="Number of new winners to pick",
                            preserve_winners="Keep previous winners and just add new ones?")
-    async def giveaway_reroll(self, interaction: discord.Interaction, giveaway_id: int, winners: int = 1,
+    async def giveaway_reroll(self, interaction: discord.Interaction, giveaway_id: str, winners: int = 1,
                               preserve_winners: bool = False):
         try:
             giveaway_id = int(giveaway_id)
@@ -2174,8 +3240,10 @@ class Giveaways(commands.Cog):
 
         async with self.acquire_db() as db:
             async with db.execute(
-                    "SELECT prize, winner_role_id, channel_id, ended FROM giveaways WHERE giveaway_id = ?",
-                    (giveaway_id,)) as cursor:
+                    "SELECT prize, winner_role_id, channel_id, ended FROM giveaways WHERE giveaway_id = ? AND guild_id = ? "
+                    "UNION ALL SELECT prize, winner_role_id, channel_id, 1 FROM giveaway_archive "
+                    "WHERE giveaway_id = ? AND guild_id = ?",
+                    (giveaway_id, interaction.guild_id, giveaway_id, interaction.guild_id)) as cursor:
                 g = await cursor.fetchone()
 
             if not g:
@@ -2196,99 +3264,184 @@ class Giveaways(commands.Cog):
         await view.wait()
 
         if view.value is True:
-            async def chunk_list(self, lst, n):
-                for i in range(0, len(lst), n):
-                    yield lst[i:i + n]
+            pool = await self.fetch_participant_snapshot(giveaway_id, interaction.guild_id)
 
             async with self.acquire_db() as db:
-                async with db.execute(
-                        "SELECT user_id FROM giveaway_participants WHERE giveaway_id = ? AND guild_id = ?",
-                        (giveaway_id, interaction.guild_id,)) as cursor:
-                    rows = await cursor.fetchall()
-
-                    pool = [r[0] for r in rows]
-
                 async with db.execute("SELECT user_id FROM giveaway_winners WHERE giveaway_id = ?",
                                       (giveaway_id,)) as cursor:
                     prev_rows = await cursor.fetchall()
-                    if not prev_rows:
-                        return await interaction.edit_original_response("This giveaway hasn't ended yet!",
-                                                                        ephemeral=True)
-                    prev_winners = [r[0] for r in prev_rows]
+            if not prev_rows:
+                return await interaction.followup.send("This giveaway hasn't ended yet!", ephemeral=True)
+            prev_winners = [r[0] for r in prev_rows]
 
-                eligible_pool = [uid for uid in pool if uid not in prev_winners]
+            prev_set = set(prev_winners)
+            eligible_pool = [uid for uid in pool if uid not in prev_set]
 
-                if not eligible_pool:
-                    return await interaction.edit_original_response("No new participants available to pick from!",
-                                                                    ephemeral=True)
+            if not eligible_pool:
+                return await interaction.followup.send("No new participants available to pick from!",
+                                                       ephemeral=True)
 
-                new_picks = random.sample(eligible_pool, min(len(eligible_pool), winners))
+            new_picks = random.sample(eligible_pool, min(len(eligible_pool), winners))
 
-                if not preserve_winners:
-                    if g[1]:
-                        role = interaction.guild.get_role(g[1])
-                        if not role:
-                            role = interaction.guild.fetch_role(g[1])
-                        if not role:
-                            await interaction.followup_send(
-                                "I can't find the role to remove from the previous winners!", ephemeral=True)
-                        if role:
-                            for chunk in chunk_list(self, prev_winners, 5):
-                                for old_uid in chunk:
-                                    member = interaction.guild.get_member(
-                                        old_uid) or await interaction.guild.fetch_member(old_uid)
-                                    if member and role in member.roles:
-                                        try:
-                                            await member.remove_roles(role, reason="Giveaway Reroll")
-                                        except discord.HTTPException:
-                                            pass
-                                await asyncio.sleep(1.5)
-                    await db.execute("DELETE FROM giveaway_winners WHERE giveaway_id = ? AND user_id = ?",
-                                     (giveaway_id, old_uid))
-
-                for new_uid in new_picks:
-                    await db.execute("INSERT INTO giveaway_winners (giveaway_id, user_id) VALUES (?, ?)",
-                                     (giveaway_id, new_uid))
-                    if g[1]:
-                        role = interaction.guild.get_role(g[1])
-                        if not role:
-                            role = interaction.guild.fetch_role(g[1])
-                        if not role:
-                            await interaction.followup_send("I can't find the role to give to the winners!",
-                                                            ephemeral=True)
-                        if role:
-                            for chunk in chunk_list(new_picks, 5):
-                                for new_uid in chunk:
-                                    member = interaction.guild.get_member(
-                                        new_uid) or await interaction.guild.fetch_member(new_uid)
-                                    if member:
-                                        try:
-                                            await member.add_roles(role, reason="Giveaway Winner")
-                                        except discord.HTTPException:
-                                            pass
-
-                                await asyncio.sleep(1.5)
+            role = interaction.guild.get_role(g[1]) if g[1] else None
+            if g[1] and not role:
+                await interaction.followup.send("I can't find the winner role for this giveaway!", ephemeral=True)
 
+            async with self.acquire_db() as db:
+                if not preserve_winners:
+                    await db.execute("DELETE FROM giveaway_winners WHERE giveaway_id = ?", (giveaway_id,))
+                await db.executemany(
+                    "INSERT OR IGNORE INTO giveaway_winners (guild_id, giveaway_id, user_id) VALUES (?, ?, ?)",
+                    [(interaction.guild_id, giveaway_id, uid) for uid in new_picks])
                 await db.commit()
 
-                channel = self.bot.get_channel(g[2])
-                if not channel:
-                    try:
-                        channel = await self.bot.fetch_channel(g[2])
-                    except (discord.Forbidden, discord.NotFound):
-                        return await interaction.response.followup_send(
-                            "I searched far and wide, but I can't find the channel chosen for the giveaway!\n\nEnsure that I have the necessary permissions so that I can announce the new winners.",
-                            ephemeral=True)
-
-                mention_str = ", ".join([f"<@{w}>" for w in new_picks])
-                mode_text = "added to the pool of winners" if preserve_winners else "selected as the new winners"
-                await channel.send(
-                    f"🎉 Congratulations to: {mention_str} for being {mode_text} for **{g[0]}**!\n\nThis giveaway has been re-rolled by {interaction.user.mention}")
+            if role:
+                summaries = []
+                if not preserve_winners:
+                    removed = await self.role_service.apply(interaction.guild, role, prev_winners,
+                                                            reason="Giveaway Reroll", remove=True)
+                    summaries.append(removed.summary("removed from"))
+                added = await self.role_service.apply(interaction.guild, role, new_picks, reason="Giveaway Winner")
+                summaries.append(added.summary())
+                await interaction.followup.send("\n".join(summaries), ephemeral=True)
+
+            channel = self.bot.get_channel(g[2])
+            if not channel:
+                try:
+                    channel = await self.bot.fetch_channel(g[2])
+                except (discord.Forbidden, discord.NotFound):
+                    return await interaction.followup.send(
+                        "I searched far and wide, but I can't find the channel chosen for the giveaway!\n\nEnsure that I have the necessary permissions so that I can announce the new winners.",
+                        ephemeral=True)
+
+            mention_str = ", ".join([f"<@{w}>" for w in new_picks])
+            mode_text = "added to the pool of winners" if preserve_winners else "selected as the new winners"
+            await channel.send(
+                f"🎉 Congratulations to: {mention_str} for being {mode_text} for **{g[0]}**!\n\nThis giveaway has been re-rolled by {interaction.user.mention}")
 
     @giveaway_reroll.autocomplete("giveaway_id")
     async def reroll_autocomplete(self, interaction: discord.Interaction, current: str):
+        rows, _ = await self.fetch_history_page(interaction.guild_id, limit=25, prize_filter=current)
+        return [app_commands.Choice(name=f"{row[1]}: {row[0]}"[:100], value=str(row[0])) for row in rows]
+
+    @giveaway.command(name="history", description="Browse ended giveaways and their winners in this server.")
+    async def giveaway_history(self, interaction: discord.Interaction):
+        view = GiveawayHistoryView(self, interaction.user, interaction.guild_id)
+        await view.load_page()
+        await interaction.response.send_message(embed=view.get_embed(), view=view, ephemeral=True)
+
+    @giveaway.command(name="export", description="Export a giveaway's entrants and winners as a CSV file.")
+    @app_commands.describe(giveaway_id="The ID of the giveaway to export.")
+    @app_commands.checks.has_permissions(manage_guild=True)
+    async def giveaway_export(self, interaction: discord.Interaction, giveaway_id: str):
+        try:
+            giveaway_id = int(giveaway_id)
+        except ValueError:
+            return await interaction.response.send_message("That is not a valid ID!", ephemeral=True)
+
+        await interaction.response.defer(ephemeral=True)
+
+        fd, path = tempfile.mkstemp(suffix=".csv.gz")
+        os.close(fd)
+        try:
+            if not await self.export_giveaway(interaction.guild, giveaway_id, path):
+                return await interaction.followup.send("Giveaway not found.", ephemeral=True)
+
+            size = os.path.getsize(path)
+            if size > interaction.guild.filesize_limit:
+                return await interaction.followup.send(
+                    f"The export is too large to upload here ({size / 1024 / 1024:.1f} MB).", ephemeral=True)
+
+            await interaction.followup.send(
+                f"Entrants and winners for giveaway `{giveaway_id}`:",
+                file=discord.File(path, filename=f"giveaway-{giveaway_id}.csv.gz"),
+                ephemeral=True)
+        finally:
+            os.remove(path)
+
+    @giveaway_export.autocomplete("giveaway_id")
+    async def export_autocomplete(self, interaction: discord.Interaction, current: str):
         return await self.giveaway_autocomplete(interaction, current, magic=False)
 
+    @giveaway.command(name="stats", description="Show giveaway statistics for this server.")
+    async def giveaway_stats(self, interaction: discord.Interaction):
+        stats = await self.fetch_stats(interaction.guild_id)
+        if not stats:
+            return await interaction.response.send_message("No giveaways have ended in this server yet.",
+                                                           ephemeral=True)
+
+        run = stats['giveaways_run']
+        embed = discord.Embed(title=f"Giveaway Stats for {interaction.guild.name}", color=discord.Color(0x8632e6))
+        embed.add_field(name="Giveaways Run", value=f"**{run}**")
+        embed.add_field(name="Unique Entrants", value=f"**{stats['unique_entrants']}**")
+        embed.add_field(name="Entries per Giveaway", value=f"**{stats['total_entries'] / run:.1f}**")
+
+        hosts = "\n".join(f"{i}. <@{host_id}>: {count}" for i, (host_id, count) in enumerate(stats['top_hosts'], 1))
+        embed.add_field(name="Top Hosts", value=hosts or "None", inline=False)
+
+        hours = "\n".join(f"{hour:02d}:00 UTC: {entries} entries across {count} giveaway(s)"
+                          for hour, count, entries in stats['busiest_hours'])
+        embed.add_field(name="Busiest Hours (by end time)", value=hours or "None", inline=False)
+
+        await interaction.response.send_message(embed=embed)
+
+    @giveaway.command(name="scheduled", description="List or cancel giveaways scheduled to start in this server.")
+    @app_commands.describe(cancel="The ID of a scheduled giveaway to cancel.")
+    async def giveaway_scheduled(self, interaction: discord.Interaction, cancel: Optional[str] = None):
+        rows = await self.fetch_scheduled(interaction.guild_id)
+
+        if cancel is not None:
+            try:
+                schedule_id = int(cancel)
+            except ValueError:
+                return await interaction.response.send_message("That is not a valid ID!", ephemeral=True)
+
+            row = next((r for r in rows if r[0] == schedule_id), None)
+            if not row:
+                return await interaction.response.send_message("Scheduled giveaway not found.", ephemeral=True)
+            if row[4] != interaction.user.id and not interaction.user.guild_permissions.manage_guild:
+                return await interaction.response.send_message(
+                    "Only the member who scheduled this giveaway or a server manager can cancel it.", ephemeral=True)
+
+            await self.cancel_scheduled(schedule_id, interaction.guild_id)
+            prize = json.loads(row[3])['prize']
+            return await interaction.response.send_message(
+                f"Cancelled the scheduled giveaway for **{prize}** (`{schedule_id}`).", ephemeral=True)
+
+        if not rows:
+            return await interaction.response.send_message("No giveaways are scheduled in this server.",
+                                                           ephemeral=True)
+
+        lines = []
+        for i, (schedule_id, channel_id, start_time, raw, created_by, failed) in enumerate(rows, 1):
+            if failed >= SCHEDULE_MAX_ATTEMPTS:
+                status = f"**Failed to start** after {failed} attempts"
+            elif failed:
+                status = f"Retrying **<t:{start_time}:R>** (attempt {failed + 1}/{SCHEDULE_MAX_ATTEMPTS})"
+            else:
+                status = f"Starts **<t:{start_time}:R>**"
+            lines.append(f"{i}. **{json.loads(raw)['prize']}** in <#{channel_id}>: {status} (`{schedule_id}`)")
+
+        full_list = "\n".join(lines)
+        if len(full_list) > 1900:
+            full_list = full_list[:1900] + "\n...and more."
+
+        embed = discord.Embed(
+            title=f"Scheduled Giveaways for {interaction.guild.name}",
+            description=full_list,
+            color=discord.Color(0x8632e6)
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @giveaway_scheduled.autocomplete("cancel")
+    async def scheduled_autocomplete(self, interaction: discord.Interaction, current: str):
+        choices = []
+        for i, (schedule_id, _, _, raw, _, _) in enumerate(await self.fetch_scheduled(interaction.guild_id), 1):
+            label = f"{i}. {json.loads(raw)['prize']}: {schedule_id}"[:100]
+            if current.lower() in label.lower():
+                choices.append(app_commands.Choice(name=label, value=str(schedule_id)))
+        return choices[:25]
+
     @giveaway.command(name="list", description="List all giveaways in this server.")
     async def giveaway_list(self, interaction: discord.Interaction):
         await interaction.response.defer()
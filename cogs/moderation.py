@@ -3,17 +3,61 @@ import aiosqlite
 import discord
 import time
 import re
+from bisect import bisect_right
+from collections import Counter, OrderedDict
 from discord import app_commands
 from discord.ext import commands, tasks
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Any, Union
+from typing import Dict, Optional, List, Any, Union, Tuple
 from contextlib import asynccontextmanager
 from config import DB_PATH
 from utils.checks import slash_mod_check
 from utils.log import LoggingManager
 
 
-def parse_duration(duration_str: str) -> Optional[int]:
+# Decays every due user in one statement: each full decay interval elapsed since the later of
+# last_punishment/last_decay removes one point, and last_decay advances by whole intervals only.
+# Rows are found through the partial next_decay_at index, so users with nothing to decay are never read.
+DECAY_SQL = '''
+    WITH due AS (
+        SELECT u.guild_id, u.user_id,
+               CASE WHEN u.last_decay > u.last_punishment THEN u.last_decay ELSE u.last_punishment END AS ref,
+               COALESCE(s.decay_interval, 14) * 86400 AS span
+        FROM users u LEFT JOIN settings s ON s.guild_id = u.guild_id
+        WHERE u.next_decay_at <= :now AND u.points > 0 AND u.last_punishment IS NOT NULL
+          AND COALESCE(s.decay_interval, 14) > 0
+    )
+    UPDATE users SET
+        points = MAX(0, users.points - (:now - due.ref) / due.span),
+        last_decay = CASE WHEN users.points - (:now - due.ref) / due.span > 0
+                          THEN due.ref + (:now - due.ref) / due.span * due.span END,
+        next_decay_at = CASE WHEN users.points - (:now - due.ref) / due.span > 0
+                             THEN due.ref + ((:now - due.ref) / due.span + 1) * due.span END
+    FROM due
+    WHERE users.guild_id = due.guild_id AND users.user_id = due.user_id AND :now - due.ref >= due.span
+    RETURNING guild_id, user_id, points, last_decay
+'''
+
+UPSERT_USER_SQL = '''
+    INSERT INTO users (guild_id, user_id, points, last_punishment, last_decay, next_decay_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (guild_id, user_id) DO UPDATE
+    SET points          = excluded.points,
+        last_punishment = excluded.last_punishment,
+        last_decay      = excluded.last_decay,
+        next_decay_at   = excluded.next_decay_at
+'''
+
+# Recomputes next_decay_at for rows of one guild (or all guilds when :guild_id is NULL), e.g. after the decay
+# interval changes.
+RESCHEDULE_DECAY_SQL = '''
+    UPDATE users SET next_decay_at = MAX(COALESCE(last_decay, 0), last_punishment) + NULLIF(COALESCE(
+        (SELECT decay_interval FROM settings s WHERE s.guild_id = users.guild_id), 14), 0) * 86400
+    WHERE (:guild_id IS NULL OR guild_id = :guild_id) AND points > 0 AND last_punishment IS NOT NULL
+'''
+
+
+def parse_duration(duration_str: str, min_seconds: int = 900, max_seconds: int = 31536000) -> Optional[int]:
     """Parses a string like '3 days', '1 week' into seconds. Returns None if invalid or 0 if permanent."""
     if not duration_str or duration_str.lower() in ["permanent", "perm", "0", "infinite"]:
         return 0
@@ -34,7 +78,7 @@ def parse_duration(duration_str: str) -> Optional[int]:
     }
 
     seconds = amount * multipliers.get(unit, 0)
-    if seconds > 0 and (seconds < 900 or seconds > 31536000):
+    if seconds > 0 and (seconds < min_seconds or seconds > max_seconds):
         return None
 
     return seconds
@@ -60,6 +104,63 @@ def format_duration_str(seconds: int) -> str:
     return f"{months} Month{'s' if months != 1 else ''}"
 
 
+IDLE_USER_CACHE_SIZE = 2048
+PURGE_CONCURRENCY = 4
+PURGE_PROGRESS_INTERVAL = 2
+UNBAN_LOOKAHEAD = 60
+UNBAN_BATCH_SIZE = 50
+UNBAN_CONCURRENCY = 5
+LEDGER_FLUSH_SECONDS = 5
+BULK_MAX_MEMBERS = 500
+BULK_CONCURRENCY = 5
+MAX_RESIDENT_GUILDS = 500
+GUILD_IDLE_SECONDS = 6 * 3600
+HISTORY_PAGE_SIZE = 5
+HISTORY_START = (2 ** 63 - 1, 2 ** 63 - 1)
+
+
+class UserRecord:
+    __slots__ = ("points", "last_punishment", "last_decay")
+
+    def __init__(self, points: int = 0, last_punishment: Optional[int] = None, last_decay: Optional[int] = None):
+        self.points = points
+        self.last_punishment = last_punishment
+        self.last_decay = last_decay
+
+
+class ZeroRecord(UserRecord):
+    """Shared stand-in for users without a row; replaced by a real record on the first write."""
+    __slots__ = ()
+
+    def __init__(self):
+        object.__setattr__(self, "points", 0)
+        object.__setattr__(self, "last_punishment", None)
+        object.__setattr__(self, "last_decay", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ZeroRecord is read-only")
+
+
+ZERO_RECORD = ZeroRecord()
+
+
+class PrivateView(discord.ui.View):
+    def __init__(self, user, cog, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user = user
+        self.cog = cog
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.user.id:
+            await interaction.response.send_message(
+                "This isn't for you!",
+                ephemeral=True
+            )
+            return False
+        await self.cog.ensure_guild(interaction.guild.id)
+        return True
+
+
 class PrivateLayoutView(discord.ui.LayoutView):
     def __init__(self, user, cog, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -73,6 +174,7 @@ class PrivateLayoutView(discord.ui.LayoutView):
                 ephemeral=True
             )
             return False
+        await self.cog.ensure_guild(interaction.guild.id)
         return True
 
 
@@ -134,6 +236,77 @@ class ConfirmationView(PrivateLayoutView):
             self.stop()
 
 
+class InfractionHistoryView(PrivateView):
+    def __init__(self, user, cog, target: discord.User, term: str):
+        super().__init__(user, cog, timeout=120)
+        self.target = target
+        self.term = term
+        self.guild_id = user.guild.id
+        self.cursors = [HISTORY_START]
+        self.rows = []
+        self.has_more = False
+
+    async def load_page(self):
+        self.rows, self.has_more = await self.cog.fetch_infractions(self.guild_id, self.target.id, self.cursors[-1])
+        self.prev_page.disabled = len(self.cursors) == 1
+        self.next_page.disabled = not self.has_more
+
+    async def get_embed(self):
+        data = await self.cog.get_user_data(self.guild_id, self.target.id)
+        last_p = f"<t:{data.last_punishment}:f>" if data.last_punishment else "never"
+        last_d = f"<t:{data.last_decay}:f>" if data.last_decay else "never"
+
+        lines = []
+        for _, moderator_id, amount, reason, action, created_at in self.rows:
+            by = f" by <@{moderator_id}>" if moderator_id else ""
+            lines.append(f"<t:{created_at}:d> **{amount:+d}** – {action or 'none'}{by}\n"
+                         f"-# {reason or 'No reason provided.'}")
+
+        embed = discord.Embed(
+            description=f"## {self.term} info\n\n{self.term}: **{data.points}**\nLast punishment: **{last_p}**\n"
+                        f"Last decay: **{last_d}**\n\n### History\n" + ("\n".join(lines) or "No history recorded."),
+            color=discord.Color(0x944ae8)
+        )
+        embed.set_author(name=f"{self.target.name} ({self.target.id})", icon_url=self.target.display_avatar.url)
+        embed.set_footer(text=f"Page {len(self.cursors)}")
+        return embed
+
+    @discord.ui.button(label="◀️", style=discord.ButtonStyle.gray)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+            await self.load_page()
+        await interaction.response.edit_message(embed=await self.get_embed(), view=self)
+
+    @discord.ui.button(label="▶️", style=discord.ButtonStyle.gray)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.has_more and self.rows:
+            last = self.rows[-1]
+            self.cursors.append((last[5], last[0]))
+            await self.load_page()
+        await interaction.response.edit_message(embed=await self.get_embed(), view=self)
+
+
+class BulkMemberSelectView(PrivateLayoutView):
+    def __init__(self, user, cog, amount: int, reason: Optional[str]):
+        super().__init__(user, cog, timeout=120)
+        self.amount = amount
+        self.reason = reason
+
+        container = discord.ui.Container()
+        container.add_item(discord.ui.TextDisplay("### Bulk Moderation"))
+        container.add_item(discord.ui.TextDisplay("Select up to 25 members to act on."))
+        self.picker = discord.ui.UserSelect(placeholder="Select members...", min_values=1, max_values=25)
+        self.picker.callback = self.select_callback
+        container.add_item(discord.ui.ActionRow(self.picker))
+        self.add_item(container)
+
+    async def select_callback(self, interaction: discord.Interaction):
+        members = [m for m in self.picker.values if isinstance(m, discord.Member)]
+        self.stop()
+        await self.cog.run_bulk(interaction, members, self.amount, self.reason)
+
+
 class ActionModal(discord.ui.Modal):
     def __init__(self, cog, guild_id, is_create=True, existing_action_id=None):
         title = "Create New Action" if is_create else "Edit Action Points"
@@ -284,7 +457,10 @@ class SettingValueModal(discord.ui.Modal):
         if guild_id in self.cog.settings_cache:
             self.cog.settings_cache[guild_id][self.setting_key] = final_val
         else:
-            await self.cog.populate_caches()
+            await self.cog.ensure_guild(guild_id, reload=True)
+
+        if self.setting_key == "decay_interval":
+            await self.cog.reschedule_decay(guild_id)
 
         view = SettingsPage(interaction.user, self.cog)
         await interaction.response.edit_message(view=view)
@@ -474,8 +650,7 @@ class CustomisationPage(PrivateLayoutView):
         is_simple = settings.get("simple_mode", 0) == 1
         term = "Warning" if is_simple else "Point"
 
-        all_actions = self.cog.action_cache.get(guild_id, [])
-        all_actions.sort(key=lambda x: x['points'])
+        all_actions = sorted(self.cog.action_cache.get(guild_id, []), key=lambda x: x['points'])
 
         total_items = len(all_actions)
         total_pages = (total_items + self.items_per_page - 1) // self.items_per_page if total_items > 0 else 1
@@ -636,24 +811,37 @@ class GoToPageModal(discord.ui.Modal):
 class Points(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.user_cache: Dict[str, Dict[str, Any]] = {}
+        self.user_cache: Dict[int, Dict[int, UserRecord]] = {}
+        self._idle_users: OrderedDict[Tuple[int, int], UserRecord] = OrderedDict()
         self.action_cache: Dict[int, List[Dict[str, Any]]] = {}
+        self.ladder_cache: Dict[int, Tuple[Tuple[int, ...], Tuple[str, ...], Tuple[Optional[timedelta], ...]]] = {}
         self.settings_cache: Dict[int, Dict[str, Any]] = {}
+        self._resident_guilds: OrderedDict[int, float] = OrderedDict()
 
         self.db_pool: Optional[asyncio.Queue] = None
+        self._unban_timers: Dict[Tuple[int, int], Tuple[int, asyncio.Task]] = {}
+        self._unban_semaphore = asyncio.Semaphore(UNBAN_CONCURRENCY)
+        self._ledger_buffer: List[Tuple] = []
 
     async def cog_load(self):
         await self.init_pools()
         await self.init_db()
-        await self.populate_caches()
         self.unban_loop.start()
         self.decay_loop.start()
+        self.ledger_flush_loop.start()
+        self.residency_loop.start()
 
     async def cog_unload(self):
         self.unban_loop.stop()
         self.decay_loop.stop()
+        self.ledger_flush_loop.stop()
+        self.residency_loop.stop()
+        for _, task in self._unban_timers.values():
+            task.cancel()
+        self._unban_timers.clear()
 
         if self.db_pool:
+            await self.flush_ledger()
             while not self.db_pool.empty():
                 try:
                     conn = self.db_pool.get_nowait()
@@ -715,6 +903,34 @@ class Points(commands.Cog):
                     simple_mode INTEGER DEFAULT 0
                 );
             ''')
+            try:
+                await db.execute("ALTER TABLE users ADD COLUMN next_decay_at INTEGER")
+                await db.execute(RESCHEDULE_DECAY_SQL, {"guild_id": None})
+            except Exception:
+                pass
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_ban_schedule_unban_at ON ban_schedule(unban_at)")
+            await db.execute('''
+                CREATE TABLE IF NOT EXISTS infractions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER,
+                    user_id INTEGER,
+                    moderator_id INTEGER,
+                    amount INTEGER,
+                    reason TEXT,
+                    action TEXT,
+                    created_at INTEGER
+                )
+            ''')
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_infractions_user ON infractions(guild_id, user_id, created_at)")
+            await db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_users_next_decay ON users(next_decay_at) WHERE next_decay_at IS NOT NULL")
+
+            async with db.execute("PRAGMA user_version") as cursor:
+                version = (await cursor.fetchone())[0]
+            if version < 1:
+                await db.execute("DELETE FROM users WHERE points = 0 AND last_punishment IS NULL AND last_decay IS NULL")
+                await db.execute("PRAGMA user_version = 1")
             await db.commit()
 
     async def apply_default_actions(self, guild_id: int):
@@ -743,43 +959,87 @@ class Points(commands.Cog):
                     await db.commit()
                     await self.refresh_action_cache(guild_id)
 
-    async def populate_caches(self):
-        self.user_cache.clear()
-        self.action_cache.clear()
-        self.settings_cache.clear()
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.guild_id:
+            await self.ensure_guild(interaction.guild_id)
+        return True
 
+    async def ensure_guild(self, guild_id: int, reload: bool = False):
+        """Pages in a guild's settings, action ladder and users on first use. Guilds stay resident while in use
+        and are evicted least-recently-used first, or by residency_loop once idle."""
+        if guild_id in self._resident_guilds and not reload:
+            self._resident_guilds[guild_id] = time.monotonic()
+            self._resident_guilds.move_to_end(guild_id)
+            return
+
+        settings = None
+        actions = []
+        users = {}
         async with self.acquire_db() as db:
-            async with db.execute("SELECT * FROM users") as cursor:
-                async for row in cursor:
-                    self.user_cache[f"{row[0]}:{row[1]}"] = {
-                        "points": row[2],
-                        "last_punishment": row[3],
-                        "last_decay": row[4]
+            async with db.execute("SELECT * FROM settings WHERE guild_id = ?", (guild_id,)) as cursor:
+                row = await cursor.fetchone()
+                if row:
+                    settings = {
+                        "punishment_dm": row[1],
+                        "punishment_log": row[2],
+                        "decay_interval": row[3],
+                        "rejoin_points": row[4],
+                        "simple_mode": row[5]
                     }
 
-            async with db.execute("SELECT * FROM actions") as cursor:
+            async with db.execute("SELECT * FROM actions WHERE guild_id = ?", (guild_id,)) as cursor:
                 async for row in cursor:
-                    guild_id = row[1]
-                    action = {
+                    actions.append({
                         "id": row[0],
                         "guild_id": row[1],
                         "action_type": row[2],
                         "duration": row[3],
                         "points": row[4]
-                    }
-                    if guild_id not in self.action_cache:
-                        self.action_cache[guild_id] = []
-                    self.action_cache[guild_id].append(action)
+                    })
 
-            async with db.execute("SELECT * FROM settings") as cursor:
+            async with db.execute("SELECT user_id, points, last_punishment, last_decay FROM users "
+                                  "WHERE guild_id = ? AND points > 0", (guild_id,)) as cursor:
                 async for row in cursor:
-                    self.settings_cache[row[0]] = {
-                        "punishment_dm": row[1],
-                        "punishment_log": row[2],
-                        "decay_interval": row[3],
-                        "rejoin_points": row[4],
-                        "simple_mode": row[5]
-                    }
+                    users[row[0]] = UserRecord(row[1], row[2], row[3])
+
+        if settings:
+            self.settings_cache[guild_id] = settings
+        if actions:
+            self.action_cache[guild_id] = actions
+            self.compile_ladder(guild_id)
+        else:
+            self.action_cache.pop(guild_id, None)
+            self.ladder_cache.pop(guild_id, None)
+
+        # Records cached while this load was awaiting are newer than what was read, so they win.
+        guild_users = self.user_cache.setdefault(guild_id, {})
+        for user_id, record in users.items():
+            guild_users.setdefault(user_id, record)
+        if not guild_users:
+            del self.user_cache[guild_id]
+
+        self._resident_guilds[guild_id] = time.monotonic()
+        self._resident_guilds.move_to_end(guild_id)
+        while len(self._resident_guilds) > MAX_RESIDENT_GUILDS:
+            self.evict_guild(next(iter(self._resident_guilds)))
+
+    def evict_guild(self, guild_id: int):
+        self._resident_guilds.pop(guild_id, None)
+        self.settings_cache.pop(guild_id, None)
+        self.action_cache.pop(guild_id, None)
+        self.ladder_cache.pop(guild_id, None)
+        self.user_cache.pop(guild_id, None)
+        for key in [key for key in self._idle_users if key[0] == guild_id]:
+            del self._idle_users[key]
+
+    @tasks.loop(minutes=30)
+    async def residency_loop(self):
+        cutoff = time.monotonic() - GUILD_IDLE_SECONDS
+        while self._resident_guilds:
+            guild_id, last_used = next(iter(self._resident_guilds.items()))
+            if last_used > cutoff:
+                break
+            self.evict_guild(guild_id)
 
     async def refresh_action_cache(self, guild_id: int):
         if guild_id in self.action_cache:
@@ -799,61 +1059,186 @@ class Points(commands.Cog):
                         self.action_cache[guild_id] = []
                     self.action_cache[guild_id].append(action)
 
-    async def get_user_data(self, guild_id: int, user_id: int) -> dict:
-        key = f"{guild_id}:{user_id}"
-        if key not in self.user_cache:
-            data = {"points": 0, "last_punishment": None, "last_decay": None}
-            self.user_cache[key] = data
-            async with self.acquire_db() as db:
-                await db.execute(
-                    "INSERT OR IGNORE INTO users (guild_id, user_id, points) VALUES (?, ?, ?)",
-                    (guild_id, user_id, 0)
-                )
-                await db.commit()
-        return self.user_cache[key]
+        self.compile_ladder(guild_id)
+
+    def compile_ladder(self, guild_id: int):
+        """Freezes a guild's actions into parallel tuples sorted by threshold for bisect lookups."""
+        actions = sorted(self.action_cache.get(guild_id, []), key=lambda x: x['points'])
+        if not actions:
+            self.ladder_cache.pop(guild_id, None)
+            return
+
+        self.ladder_cache[guild_id] = (
+            tuple(a['points'] for a in actions),
+            tuple(a['action_type'] for a in actions),
+            tuple(timedelta(seconds=a['duration']) if a['duration'] > 0 else None for a in actions)
+        )
+
+    def _cache_user(self, guild_id: int, user_id: int, record: UserRecord):
+        """Keeps users with points resident; zero-point users only live in a bounded LRU."""
+        if record.points > 0:
+            self._idle_users.pop((guild_id, user_id), None)
+            self.user_cache.setdefault(guild_id, {})[user_id] = record
+            return
+
+        guild_users = self.user_cache.get(guild_id)
+        if guild_users is not None:
+            guild_users.pop(user_id, None)
+            if not guild_users:
+                del self.user_cache[guild_id]
+
+        self._idle_users[(guild_id, user_id)] = record
+        self._idle_users.move_to_end((guild_id, user_id))
+        if len(self._idle_users) > IDLE_USER_CACHE_SIZE:
+            self._idle_users.popitem(last=False)
+
+    async def get_user_data(self, guild_id: int, user_id: int) -> UserRecord:
+        guild_users = self.user_cache.get(guild_id)
+        if guild_users is not None:
+            record = guild_users.get(user_id)
+            if record is not None:
+                return record
+
+        record = self._idle_users.get((guild_id, user_id))
+        if record is not None:
+            self._idle_users.move_to_end((guild_id, user_id))
+            return record
+
+        async with self.acquire_db() as db:
+            async with db.execute(
+                    "SELECT points, last_punishment, last_decay FROM users WHERE guild_id = ? AND user_id = ?",
+                    (guild_id, user_id)) as cursor:
+                row = await cursor.fetchone()
+
+        record = UserRecord(*row) if row else ZERO_RECORD
+        self._cache_user(guild_id, user_id, record)
+        return record
+
+    def get_next_decay(self, guild_id: int, points: int, last_punishment: Optional[int],
+                       last_decay: Optional[int]) -> Optional[int]:
+        days = self.settings_cache.get(guild_id, {}).get("decay_interval", 14)
+        if points <= 0 or not last_punishment or days == 0:
+            return None
+        reference_ts = last_decay if (last_decay and last_decay > last_punishment) else last_punishment
+        return reference_ts + days * 86400
+
+    async def reschedule_decay(self, guild_id: int):
+        async with self.acquire_db() as db:
+            await db.execute(RESCHEDULE_DECAY_SQL, {"guild_id": guild_id})
+            await db.commit()
 
     async def update_user_points(self, guild_id: int, user_id: int, points: int, punishment_ts: Optional[int] = None):
-        key = f"{guild_id}:{user_id}"
         data = await self.get_user_data(guild_id, user_id)
-        data["points"] = points
+        if data is ZERO_RECORD:
+            if points == 0 and not punishment_ts:
+                return
+            data = UserRecord()
+        data.points = points
         if punishment_ts:
-            data["last_punishment"] = punishment_ts
-            data["last_decay"] = None
+            data.last_punishment = punishment_ts
+            data.last_decay = None
 
-        self.user_cache[key] = data
+        self._cache_user(guild_id, user_id, data)
+        next_decay_at = self.get_next_decay(guild_id, points, data.last_punishment, data.last_decay)
 
         async with self.acquire_db() as db:
-            await db.execute('''
-                             UPDATE users
-                             SET points          = ?,
-                                 last_punishment = ?,
-                                 last_decay      = ?
-                             WHERE guild_id = ?
-                               AND user_id = ?
-                             ''', (points, data["last_punishment"], data["last_decay"], guild_id, user_id))
+            await db.execute(UPSERT_USER_SQL,
+                             (guild_id, user_id, points, data.last_punishment, data.last_decay, next_decay_at))
             await db.commit()
 
-    def get_punishment_data(self, points: int, guild_id: int):
-        actions = self.action_cache.get(guild_id, [])
-        if not actions:
-            return None, None
+    async def get_users_data(self, guild_id: int, user_ids: List[int]) -> Dict[int, UserRecord]:
+        records = {}
+        missing = []
+        guild_users = self.user_cache.get(guild_id, {})
+        for user_id in user_ids:
+            record = guild_users.get(user_id) or self._idle_users.get((guild_id, user_id))
+            if record is None:
+                missing.append(user_id)
+            else:
+                records[user_id] = record
 
-        actions.sort(key=lambda x: x['points'])
+        found = {}
+        if missing:
+            async with self.acquire_db() as db:
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    marks = ", ".join("?" * len(chunk))
+                    async with db.execute(f"SELECT user_id, points, last_punishment, last_decay FROM users "
+                                          f"WHERE guild_id = ? AND user_id IN ({marks})", (guild_id, *chunk)) as cursor:
+                        async for row in cursor:
+                            found[row[0]] = UserRecord(row[1], row[2], row[3])
+
+        for user_id in missing:
+            record = found.get(user_id, ZERO_RECORD)
+            self._cache_user(guild_id, user_id, record)
+            records[user_id] = record
+        return records
+
+    async def bulk_update_points(self, guild_id: int, records: Dict[int, UserRecord], new_points: Dict[int, int],
+                                 punishment_ts: int):
+        rows = []
+        for user_id, points in new_points.items():
+            data = records[user_id]
+            if data is ZERO_RECORD:
+                data = records[user_id] = UserRecord()
+            data.points = points
+            data.last_punishment = punishment_ts
+            data.last_decay = None
+            self._cache_user(guild_id, user_id, data)
+            rows.append((guild_id, user_id, points, punishment_ts, None,
+                         self.get_next_decay(guild_id, points, punishment_ts, None)))
 
-        triggered_action = None
-        for action in actions:
-            if points >= action['points']:
-                triggered_action = action
-            else:
-                break
+        async with self.acquire_db() as db:
+            await db.executemany(UPSERT_USER_SQL, rows)
+            await db.commit()
+
+    def record_infraction(self, guild_id: int, user_id: int, moderator_id: Optional[int], amount: int,
+                          reason: Optional[str], action: Optional[str]):
+        """Queues a ledger entry; entries are written in batches by ledger_flush_loop."""
+        self._ledger_buffer.append((guild_id, user_id, moderator_id, amount, reason, action, int(time.time())))
 
-        if triggered_action:
-            dur = None
-            if triggered_action['duration'] > 0:
-                dur = timedelta(seconds=triggered_action['duration'])
-            return triggered_action['action_type'], dur
+    async def flush_ledger(self):
+        if not self._ledger_buffer:
+            return
 
-        return "warning", None
+        pending, self._ledger_buffer = self._ledger_buffer, []
+        try:
+            async with self.acquire_db() as db:
+                await db.executemany(
+                    "INSERT INTO infractions (guild_id, user_id, moderator_id, amount, reason, action, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)", pending)
+                await db.commit()
+        except Exception as e:
+            self._ledger_buffer[:0] = pending
+            print(f"Error flushing infraction ledger: {e}")
+
+    @tasks.loop(seconds=LEDGER_FLUSH_SECONDS)
+    async def ledger_flush_loop(self):
+        await self.flush_ledger()
+
+    async def fetch_infractions(self, guild_id: int, user_id: int, before: tuple = HISTORY_START,
+                                limit: int = HISTORY_PAGE_SIZE):
+        await self.flush_ledger()
+        async with self.acquire_db() as db:
+            async with db.execute('''
+                SELECT id, moderator_id, amount, reason, action, created_at FROM infractions
+                WHERE guild_id = ? AND user_id = ? AND (created_at, id) < (?, ?)
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+            ''', (guild_id, user_id, *before, limit + 1)) as cursor:
+                rows = await cursor.fetchall()
+        return rows[:limit], len(rows) > limit
+
+    def get_punishment_data(self, points: int, guild_id: int):
+        ladder = self.ladder_cache.get(guild_id)
+        if not ladder:
+            return None, None
+
+        thresholds, action_types, durations = ladder
+        i = bisect_right(thresholds, points) - 1
+        if i < 0:
+            return "warning", None
+        return action_types[i], durations[i]
 
     async def get_log_channel(self, guild: discord.Guild):
         if hasattr(self, 'manager'):
@@ -869,13 +1254,13 @@ class Points(commands.Cog):
         return None
 
     async def apply_punishment(self, interaction: discord.Interaction, member: discord.Member, amount: int,
-                               reason: str):
+                               reason: str, log: bool = True) -> bool:
         settings = self.settings_cache.get(interaction.guild.id, {})
         is_simple = settings.get("simple_mode", 0) == 1
         term = "warning" if is_simple else "point"
 
         action, duration = self.get_punishment_data(amount, interaction.guild.id)
-        if not action: return
+        if not action: return True
 
         reason_text = f"{term.title()}s: {amount} | {reason or 'No reason provided.'}"
 
@@ -944,6 +1329,7 @@ class Points(commands.Cog):
                 await member.kick(reason=reason_text)
             elif action == "ban":
                 await interaction.guild.ban(member, reason=reason_text, delete_message_days=0)
+                self.cancel_unban(interaction.guild.id, member.id)
                 if duration:
                     unban_ts = int((discord.utils.utcnow() + duration).timestamp())
                     async with self.acquire_db() as db:
@@ -952,44 +1338,101 @@ class Points(commands.Cog):
                             (interaction.guild.id, member.id, unban_ts)
                         )
                         await db.commit()
+                    if unban_ts <= time.time() + UNBAN_LOOKAHEAD:
+                        self.schedule_unban(interaction.guild.id, member.id, unban_ts)
+                else:
+                    async with self.acquire_db() as db:
+                        await db.execute("DELETE FROM ban_schedule WHERE guild_id = ? AND user_id = ?",
+                                         (interaction.guild.id, member.id))
+                        await db.commit()
         except discord.Forbidden:
+            if not log:
+                return False
             await interaction.followup.send("Failed to execute punishment. Check my permissions.", ephemeral=True)
 
-        if settings.get("punishment_log", 1):
+        if log and settings.get("punishment_log", 1):
             log_ch = await self.get_log_channel(interaction.guild)
             if log_ch:
                 await log_ch.send(embed=log_embed)
+        return True
 
-    @tasks.loop(seconds=60)
+    @tasks.loop(seconds=UNBAN_LOOKAHEAD)
     async def unban_loop(self):
-        now = int(discord.utils.utcnow().timestamp())
-        async with self.acquire_db() as db:
-            async with db.execute(
-                    "SELECT guild_id, user_id FROM ban_schedule WHERE unban_at <= ?",
-                    (now,)
-            ) as cursor:
-                rows = await cursor.fetchall()
+        """Arms exact-time timers for every ban expiring before the next iteration, a page at a time."""
+        horizon = int(time.time()) + UNBAN_LOOKAHEAD
+        last = (-1, -1, -1)
+        while True:
+            async with self.acquire_db() as db:
+                async with db.execute(
+                        "SELECT guild_id, user_id, unban_at FROM ban_schedule "
+                        "WHERE unban_at <= ? AND (unban_at, guild_id, user_id) > (?, ?, ?) "
+                        "ORDER BY unban_at, guild_id, user_id LIMIT ?",
+                        (horizon, last[2], last[0], last[1], UNBAN_BATCH_SIZE)
+                ) as cursor:
+                    rows = await cursor.fetchall()
+
+            for guild_id, user_id, unban_at in rows:
+                self.schedule_unban(guild_id, user_id, unban_at)
+
+            if len(rows) < UNBAN_BATCH_SIZE:
+                break
+            last = rows[-1]
+
+    @unban_loop.before_loop
+    async def before_unban_loop(self):
+        await self.bot.wait_until_ready()
+
+    def schedule_unban(self, guild_id: int, user_id: int, unban_at: int):
+        key = (guild_id, user_id)
+        existing = self._unban_timers.get(key)
+        if existing and not existing[1].done():
+            if existing[0] == unban_at:
+                return
+            existing[1].cancel()
+        self._unban_timers[key] = (unban_at, asyncio.create_task(self._unban_when_due(guild_id, user_id, unban_at)))
+
+    def cancel_unban(self, guild_id: int, user_id: int):
+        existing = self._unban_timers.pop((guild_id, user_id), None)
+        if existing:
+            existing[1].cancel()
+
+    async def _unban_when_due(self, guild_id: int, user_id: int, unban_at: int):
+        delay = unban_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-            for guild_id, user_id in rows:
-                guild = self.bot.get_guild(guild_id) or await self.bot.fetch_guild(guild_id)
-                if guild:
-                    try:
-                        await guild.unban(discord.Object(id=user_id), reason="Temporary ban expired")
+        try:
+            async with self._unban_semaphore:
+                await self.process_unban(guild_id, user_id, unban_at)
+        finally:
+            entry = self._unban_timers.get((guild_id, user_id))
+            if entry and entry[1] is asyncio.current_task():
+                del self._unban_timers[(guild_id, user_id)]
 
-                        settings = self.settings_cache.get(guild_id, {})
-                        rejoin_pts = settings.get("rejoin_points", 4)
-                        if rejoin_pts != -1:
-                            await self.update_user_points(guild_id, user_id, rejoin_pts)
+    async def process_unban(self, guild_id: int, user_id: int, unban_at: int):
+        await self.ensure_guild(guild_id)
+        try:
+            guild = self.bot.get_guild(guild_id) or await self.bot.fetch_guild(guild_id)
+            await guild.unban(discord.Object(id=user_id), reason="Temporary ban expired")
 
-                    except discord.NotFound:
-                        pass
-                    except Exception as e:
-                        print(f"Error unbanning {user_id} in {guild_id}: {e}")
+            settings = self.settings_cache.get(guild_id, {})
+            rejoin_pts = settings.get("rejoin_points", 4)
+            if rejoin_pts != -1:
+                data = await self.get_user_data(guild_id, user_id)
+                self.record_infraction(guild_id, user_id, None, rejoin_pts - data.points, "Temporary ban expired",
+                                       "rejoin")
+                await self.update_user_points(guild_id, user_id, rejoin_pts)
 
-                await db.execute(
-                    "DELETE FROM ban_schedule WHERE guild_id = ? AND user_id = ?",
-                    (guild_id, user_id)
-                )
+        except discord.NotFound:
+            pass
+        except Exception as e:
+            print(f"Error unbanning {user_id} in {guild_id}: {e}")
+
+        async with self.acquire_db() as db:
+            await db.execute(
+                "DELETE FROM ban_schedule WHERE guild_id = ? AND user_id = ? AND unban_at = ?",
+                (guild_id, user_id, unban_at)
+            )
             await db.commit()
 
     @tasks.loop(hours=6)
@@ -997,46 +1440,23 @@ class Points(commands.Cog):
         now = int(discord.utils.utcnow().timestamp())
 
         async with self.acquire_db() as db:
-            for key, data in list(self.user_cache.items()):
-                guild_id_str, user_id_str = key.split(":")
-                guild_id, user_id = int(guild_id_str), int(user_id_str)
-
-                points = data["points"]
-                last_p = data["last_punishment"]
-                last_d = data["last_decay"]
-
-                if points <= 0 or not last_p:
-                    continue
-
-                settings = self.settings_cache.get(guild_id, {})
-                days = settings.get("decay_interval", 14)
-
-                if days == 0: continue
-
-                interval_seconds = days * 86400
-
-                reference_ts = last_d if (last_d and last_d > last_p) else last_p
-
-                elapsed = now - reference_ts
-                periods = elapsed // interval_seconds
-
-                if periods > 0:
-                    new_points = max(0, points - periods)
-                    new_decay_ts = reference_ts + (periods * interval_seconds)
-
-                    data["points"] = new_points
-                    data["last_decay"] = new_decay_ts if new_points > 0 else None
-
-                    await db.execute('''
-                                     UPDATE users
-                                     SET points     = ?,
-                                         last_decay = ?
-                                     WHERE guild_id = ?
-                                       AND user_id = ?
-                                     ''', (new_points, data["last_decay"], guild_id, user_id))
-
+            await db.execute("BEGIN IMMEDIATE")
+            async with db.execute("SELECT guild_id, user_id, points FROM users WHERE next_decay_at <= ?",
+                                  (now,)) as cursor:
+                previous = {(row[0], row[1]): row[2] for row in await cursor.fetchall()}
+            async with db.execute(DECAY_SQL, {"now": now}) as cursor:
+                changed = await cursor.fetchall()
             await db.commit()
 
+        for guild_id, user_id, points, last_decay in changed:
+            self.record_infraction(guild_id, user_id, None, points - previous[(guild_id, user_id)], None, "decay")
+            data = self.user_cache.get(guild_id, {}).get(user_id)
+            if data is not None:
+                data.points = points
+                data.last_decay = last_decay
+                if points == 0:
+                    self._cache_user(guild_id, user_id, data)
+
     mod_group = app_commands.Group(name="moderation", description="Moderation system settings")
 
     @mod_group.command(name="dashboard", description="Open the moderation dashboard.")
@@ -1051,6 +1471,108 @@ class Points(commands.Cog):
         await self.apply_default_actions(interaction.guild.id)
         await interaction.response.send_message(view=ModerationDashboard(interaction.user, self))
 
+    @mod_group.command(name="bulk", description="Add points to many members at once (raid response).")
+    @app_commands.check(slash_mod_check)
+    @app_commands.describe(amount="Points (or warnings) to add to each member.",
+                           joined_within="Target members who joined within this window (e.g. 10m, 2h).",
+                           name_pattern="Target members whose username or display name matches this regex.",
+                           reason="Reason shown to the members and in the log.")
+    async def moderation_bulk(self, interaction: discord.Interaction, amount: int = 1,
+                              joined_within: Optional[str] = None, name_pattern: Optional[str] = None,
+                              reason: Optional[str] = None):
+        settings = self.settings_cache.get(interaction.guild.id, {})
+        if settings.get("simple_mode", 0) == 1 and amount != 1:
+            return await interaction.response.send_message("Simple Mode is enabled, so only 1 warning can be added.",
+                                                           ephemeral=True)
+        if amount < 1:
+            return await interaction.response.send_message("Amount must be at least 1.", ephemeral=True)
+
+        if joined_within is None and name_pattern is None:
+            return await interaction.response.send_message(
+                view=BulkMemberSelectView(interaction.user, self, amount, reason), ephemeral=True)
+
+        members = interaction.guild.members
+        if joined_within is not None:
+            window = parse_duration(joined_within, min_seconds=60, max_seconds=2592000)
+            if not window:
+                return await interaction.response.send_message("Invalid join window (1 minute to 1 month).",
+                                                               ephemeral=True)
+            since = discord.utils.utcnow() - timedelta(seconds=window)
+            members = [m for m in members if m.joined_at and m.joined_at >= since]
+
+        if name_pattern is not None:
+            try:
+                pattern = re.compile(name_pattern[:100], re.IGNORECASE)
+            except re.error:
+                return await interaction.response.send_message("Invalid name pattern.", ephemeral=True)
+            members = [m for m in members if pattern.search(m.name) or pattern.search(m.display_name)]
+
+        await self.run_bulk(interaction, members, amount, reason)
+
+    async def run_bulk(self, interaction: discord.Interaction, members: List[discord.Member], amount: int,
+                       reason: Optional[str]):
+        guild = interaction.guild
+        members = [m for m in members if not m.bot and m.id not in (interaction.user.id, guild.owner_id)
+                   and m.top_role < guild.me.top_role]
+        if not members:
+            return await interaction.response.send_message("No members matched.", ephemeral=True)
+        if len(members) > BULK_MAX_MEMBERS:
+            return await interaction.response.send_message(
+                f"That matches {len(members)} members; narrow it down to at most {BULK_MAX_MEMBERS}.", ephemeral=True)
+
+        settings = self.settings_cache.get(guild.id, {})
+        term = "warning" if settings.get("simple_mode", 0) == 1 else "point"
+        preview = ", ".join(m.mention for m in members[:20])
+        if len(members) > 20:
+            preview += f" and {len(members) - 20} more"
+        view = ConfirmationView(
+            interaction.user, self,
+            "Bulk Moderation",
+            f"Add **{amount}** {term}(s) to **{len(members)}** member(s)?\n{preview}",
+            discord.Color.red()
+        )
+        await interaction.response.send_message(view=view)
+        view.message = await interaction.original_response()
+        await view.wait()
+        if not view.value:
+            return
+
+        now = int(time.time())
+        records = await self.get_users_data(guild.id, [m.id for m in members])
+        new_points = {m.id: max(0, records[m.id].points + amount) for m in members}
+        actions = Counter()
+        for m in members:
+            action, _ = self.get_punishment_data(new_points[m.id], guild.id)
+            actions[action or "none"] += 1
+            self.record_infraction(guild.id, m.id, interaction.user.id, new_points[m.id] - records[m.id].points,
+                                   reason, action)
+        await self.bulk_update_points(guild.id, records, new_points, now)
+
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def punish(member: discord.Member):
+            async with semaphore:
+                return await self.apply_punishment(interaction, member, new_points[member.id], reason, log=False)
+
+        results = await asyncio.gather(*(punish(m) for m in members), return_exceptions=True)
+        failed = [m for m, ok in zip(members, results) if ok is not True]
+
+        summary = discord.Embed(
+            description=(f"## Bulk Moderation\n\nAdded **{amount}** {term}(s) to **{len(members)}** member(s).\n\n"
+                         + "\n".join(f"* {action.title()}: **{count}**" for action, count in actions.most_common())
+                         + (f"\n\nFailed to punish **{len(failed)}**: " + ", ".join(m.mention for m in failed[:20])
+                            if failed else "")
+                         + f"\n\n**Reason**: {reason or 'No reason provided.'}"),
+            color=discord.Color.red()
+        )
+        summary.set_footer(text=f"by {interaction.user}", icon_url=interaction.user.display_avatar.url)
+        await interaction.followup.send(embed=summary)
+
+        if settings.get("punishment_log", 1):
+            log_ch = await self.get_log_channel(guild)
+            if log_ch:
+                await log_ch.send(embed=summary)
+
     @app_commands.command(name="point", description="Add points to a user.")
     @app_commands.check(slash_mod_check)
     @app_commands.describe(delete_messages="Delete the user's messages across all channels (up to 14 days old).")
@@ -1078,25 +1600,33 @@ class Points(commands.Cog):
     async def _add_infraction(self, interaction: discord.Interaction, member: discord.Member, amount: int, reason: str, delete_messages: bool = False):
         await interaction.response.defer()
 
+        purged = None
         if delete_messages:
-            def is_user(m):
-                return m.author.id == member.id
+            last_report = 0.0
 
-            for channel in interaction.guild.text_channels:
+            async def report(done: int, total: int, deleted: int):
+                nonlocal last_report
+                if done < total and time.monotonic() - last_report < PURGE_PROGRESS_INTERVAL:
+                    return
+                last_report = time.monotonic()
                 try:
-                    await channel.purge(limit=None, check=is_user, bulk=True)
-                except discord.Forbidden:
-                    continue
-                except Exception:
-                    continue
+                    await interaction.edit_original_response(
+                        content=f"Deleting messages from {member.mention}... {done}/{total} channels, {deleted} deleted.")
+                except discord.HTTPException:
+                    pass
+
+            purged = await self.purge_member_messages(interaction.guild, member, report)
 
         data = await self.get_user_data(interaction.guild.id, member.id)
-        new_points = max(0, data["points"] + amount)
+        old_points = data.points
+        new_points = max(0, old_points + amount)
         now = int(time.time())
 
         await self.update_user_points(interaction.guild.id, member.id, new_points, punishment_ts=now)
 
         action, duration = self.get_punishment_data(new_points, interaction.guild.id)
+        self.record_infraction(interaction.guild.id, member.id, interaction.user.id, new_points - old_points,
+                               reason, action)
         settings = self.settings_cache.get(interaction.guild.id, {})
         term = "warning" if settings.get("simple_mode", 0) == 1 else "point"
 
@@ -1115,24 +1645,68 @@ class Points(commands.Cog):
             color=discord.Color.red()
         )
         embed.set_author(name=f"{member.display_name} ({member.id})", icon_url=member.display_avatar.url)
-        embed.set_footer(text=f"by {interaction.user}")
+        footer = f"by {interaction.user}"
+        if purged is not None:
+            footer += f" • {purged} message(s) deleted"
+        embed.set_footer(text=footer)
 
-        await interaction.edit_original_response(embed=embed)
+        await interaction.edit_original_response(content=None, embed=embed)
         await self.apply_punishment(interaction, member, new_points, reason)
 
+    async def purge_member_messages(self, guild: discord.Guild, member: discord.abc.Snowflake,
+                                    on_progress=None) -> int:
+        """Deletes a member's messages from the bulk-deletable window (14 days) in all readable text channels,
+        a few channels at a time. Returns the number of messages deleted."""
+        after = discord.utils.utcnow() - timedelta(days=14)
+        channels = []
+        for channel in guild.text_channels:
+            perms = channel.permissions_for(guild.me)
+            if perms.manage_messages and perms.read_message_history:
+                channels.append(channel)
+
+        semaphore = asyncio.Semaphore(PURGE_CONCURRENCY)
+        done = 0
+        deleted = 0
+
+        def is_user(m):
+            return m.author.id == member.id
+
+        async def purge(channel: discord.TextChannel):
+            nonlocal done, deleted
+            async with semaphore:
+                try:
+                    removed = await channel.purge(limit=None, check=is_user, after=after, bulk=True)
+                    deleted += len(removed)
+                except discord.Forbidden:
+                    pass
+                except Exception as e:
+                    print(f"Error purging messages from {member.id} in #{channel.name} ({guild.id}): {e}")
+            done += 1
+            if on_progress:
+                await on_progress(done, len(channels), deleted)
+
+        await asyncio.gather(*(purge(channel) for channel in channels))
+        return deleted
+
     @app_commands.command(name="pardon", description="Remove points/warnings from a user.")
     @app_commands.check(slash_mod_check)
     async def pardon(self, interaction: discord.Interaction, member: discord.Member, amount: int,
                      reason: Optional[str] = None):
         data = await self.get_user_data(interaction.guild.id, member.id)
-        old_points = data["points"]
+        old_points = data.points
         new_points = max(0, old_points - amount)
 
-        await self.update_user_points(interaction.guild.id, member.id, new_points)
-
         settings = self.settings_cache.get(interaction.guild.id, {})
         term = "Warnings" if settings.get("simple_mode", 0) == 1 else "Points"
 
+        if new_points == old_points:
+            return await interaction.response.send_message(
+                f"{member.mention} has no {term.lower()} to pardon.", ephemeral=True)
+
+        await self.update_user_points(interaction.guild.id, member.id, new_points)
+        self.record_infraction(interaction.guild.id, member.id, interaction.user.id, new_points - old_points, reason,
+                               "pardon")
+
         embed = discord.Embed(
             description=f"## {term} Updated\n\n{term} removed: **{amount}**\nOld: **{old_points}** | New: **{new_points}**\n\n{f"**Reason**: {reason}" if reason else "**Reason**: No reason provided."}",
             color=discord.Color(0x944ae8)
@@ -1157,6 +1731,7 @@ class Points(commands.Cog):
     async def unban(self, interaction: discord.Interaction, user: discord.User, reason: Optional[str] = None):
         try:
             await interaction.guild.unban(user, reason=f"Unbanned by {interaction.user}: {reason}")
+            self.cancel_unban(interaction.guild.id, user.id)
 
             async with self.acquire_db() as db:
                 await db.execute("DELETE FROM ban_schedule WHERE guild_id = ? AND user_id = ?",
@@ -1166,6 +1741,9 @@ class Points(commands.Cog):
             settings = self.settings_cache.get(interaction.guild.id, {})
             rejoin_pts = settings.get("rejoin_points", 4)
             if rejoin_pts != -1:
+                data = await self.get_user_data(interaction.guild.id, user.id)
+                self.record_infraction(interaction.guild.id, user.id, interaction.user.id, rejoin_pts - data.points,
+                                       reason, "unban")
                 await self.update_user_points(interaction.guild.id, user.id, rejoin_pts)
 
             await interaction.response.send_message(
@@ -1203,17 +1781,9 @@ class Points(commands.Cog):
         await self._show_info(interaction, user, "Warnings")
 
     async def _show_info(self, interaction: discord.Interaction, user: discord.User, term: str):
-        data = await self.get_user_data(interaction.guild.id, user.id)
-
-        last_p = f"<t:{data['last_punishment']}:f>" if data['last_punishment'] else "never"
-        last_d = f"<t:{data['last_decay']}:f>" if data['last_decay'] else "never"
-
-        embed = discord.Embed(
-            description=f"## {term} info\n\n{term}: **{data['points']}**\nLast punishment: **{last_p}**\nLast decay: **{last_d}**",
-            color=discord.Color(0x944ae8)
-        )
-        embed.set_author(name=f"{user.name} ({user.id})", icon_url=user.display_avatar.url)
-        await interaction.response.send_message(embed=embed)
+        view = InfractionHistoryView(interaction.user, self, user, term)
+        await view.load_page()
+        await interaction.response.send_message(embed=await view.get_embed(), view=view)
 
 
 async def setup(bot):
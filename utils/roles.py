@@ -0,0 +1,85 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+import discord
+
+
+@dataclass
+class RoleGrantResult:
+    succeeded: List[int] = field(default_factory=list)
+    failed: Dict[int, str] = field(default_factory=dict)
+
+    def summary(self, verb: str = "given to") -> str:
+        text = f"Role {verb} **{len(self.succeeded)}** member(s)."
+        if self.failed:
+            text += f" Failed for **{len(self.failed)}**: " + ", ".join(
+                f"<@{uid}> ({why})" for uid, why in list(self.failed.items())[:10])
+            if len(self.failed) > 10:
+                text += f" and {len(self.failed) - 10} more"
+        return text
+
+
+class RoleGrantService:
+    """Adds or removes one role on many members concurrently, bounded per guild, retrying rate limits."""
+
+    def __init__(self, concurrency: int = 5, max_retries: int = 3):
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self._guild_semaphores: Dict[int, asyncio.Semaphore] = {}
+
+    def _semaphore(self, guild_id: int) -> asyncio.Semaphore:
+        if guild_id not in self._guild_semaphores:
+            self._guild_semaphores[guild_id] = asyncio.Semaphore(self.concurrency)
+        return self._guild_semaphores[guild_id]
+
+    async def apply(self, guild: discord.Guild, role: discord.Role, member_ids: Iterable[int],
+                    reason: str = None, remove: bool = False) -> RoleGrantResult:
+        result = RoleGrantResult()
+        semaphore = self._semaphore(guild.id)
+
+        async def worker(user_id: int):
+            async with semaphore:
+                error = await self._apply_one(guild, role, user_id, reason, remove)
+            if error:
+                result.failed[user_id] = error
+            else:
+                result.succeeded.append(user_id)
+
+        await asyncio.gather(*(worker(uid) for uid in dict.fromkeys(member_ids)))
+        return result
+
+    async def _apply_one(self, guild: discord.Guild, role: discord.Role, user_id: int, reason: str,
+                         remove: bool):
+        member = guild.get_member(user_id)
+        if member is None:
+            try:
+                member = await guild.fetch_member(user_id)
+            except discord.NotFound:
+                return "not in server"
+            except discord.HTTPException as e:
+                return f"lookup failed ({e.status})"
+
+        if remove and role not in member.roles:
+            return None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                if remove:
+                    await member.remove_roles(role, reason=reason)
+                else:
+                    await member.add_roles(role, reason=reason)
+                return None
+            except discord.Forbidden:
+                return "missing permissions"
+            except discord.NotFound:
+                return "not in server"
+            except discord.RateLimited as e:
+                if attempt == self.max_retries:
+                    return "rate limited"
+                await asyncio.sleep(e.retry_after)
+            except discord.HTTPException as e:
+                if (e.status != 429 and e.status < 500) or attempt == self.max_retries:
+                    return f"HTTP {e.status}"
+                await asyncio.sleep(2 ** attempt)
+        return "rate limited"
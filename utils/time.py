@@ -23,4 +23,15 @@ def get_duration_to_seconds(duration_str: str) -> int:
 
 def get_now_plus_seconds_unix(seconds: int) -> int:
     future_dt = datetime.now(timezone.utc) + timedelta(seconds=seconds)
-    return int(future_dt.timestamp())
\ No newline at end of file
+    return int(future_dt.timestamp())
+
+def format_seconds_to_duration(seconds: int) -> str:
+    units = [('mon', 2592000), ('w', 604800), ('d', 86400), ('h', 3600), ('m', 60), ('s', 1)]
+    parts = []
+
+    for unit, size in units:
+        amount, seconds = divmod(seconds, size)
+        if amount:
+            parts.append(f"{amount}{unit}")
+
+    return " ".join(parts) or "0s"